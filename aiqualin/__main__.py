@@ -1,4 +1,14 @@
+import argparse
+
 from aiqualin.classes.manual_game import ManualGame
+from aiqualin.classes.profiling import (
+    add_profiling_arguments,
+    configure_profiling_from_arguments,
+)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play a game of Aqualin.")
+    add_profiling_arguments(parser)
+    configure_profiling_from_arguments(parser.parse_args())
+
     ManualGame().play()
@@ -0,0 +1,271 @@
+"""
+Measure the latency of the hot paths on fixed, seeded positions.
+
+Example:
+    python -m aiqualin.bench --output before.json
+    python -m aiqualin.bench --players SimpleScoreBasedAI MCTSAI --repeat 3
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from statistics import fmean, median, pstdev
+
+from aiqualin import __version__
+from aiqualin.classes.action_generator import (
+    ActionGenerator,
+    cells_occupancy,
+    sample_encoded_action,
+)
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.encoded_action import EncodedAction
+from aiqualin.classes.game import N_OPEN_TILES, create_full_closed_tiles
+from aiqualin.classes.game_scorer import GameScorer
+from aiqualin.classes.score_cache import ScoreCache
+from aiqualin.classes.tile import Tile
+from aiqualin.classes.timer import Timer
+from aiqualin.tournament import load_player_class
+
+# the number of tiles on the board in the positions of every phase
+PHASE_N_TILES = {"opening": 2, "midgame": 16, "endgame": 30}
+
+# the players that are measured by default, with options that keep a full run
+# at a few minutes
+DEFAULT_PLAYER_OPTIONS = {
+    "SimpleScoreBasedAI": {},
+    "AlphaBetaAI": {"depth": 2, "max_branching": 10},
+    "ExpectimaxAI": {"depth": 2, "max_branching": 5, "n_samples": 2},
+    "MCTSAI": {"n_iterations": 200},
+}
+
+
+@dataclass(frozen=True)
+class Position:
+    board: Board
+    open_tiles: list[Tile]
+    closed_tiles: list[Tile]
+
+
+def create_position(rng: random.Random, n_tiles: int) -> Position:
+    """Play random actions from the start of a game until `n_tiles` are placed."""
+    closed_tiles = create_full_closed_tiles()
+    rng.shuffle(closed_tiles)
+    open_tiles = [closed_tiles.pop() for _ in range(N_OPEN_TILES)]
+
+    board = CompactBoard.empty_board()
+    for _ in range(n_tiles):
+        encoded_action = sample_encoded_action(
+            cells_occupancy(board.cells), [tile.code for tile in open_tiles], rng
+        )
+        board = board.apply_encoded_action(encoded_action)
+        open_tiles.remove(Tile.from_code(EncodedAction(encoded_action).tile_code))
+        if closed_tiles:
+            open_tiles.append(closed_tiles.pop())
+
+    return Position(
+        board=board.to_board(), open_tiles=open_tiles, closed_tiles=closed_tiles
+    )
+
+
+def create_corpus(seed: int, n_positions: int) -> dict[str, list[Position]]:
+    """Return `n_positions` positions for every phase, the same for every seed."""
+    return {
+        phase: [
+            create_position(random.Random(f"{seed}:{phase}:{i}"), n_tiles)
+            for i in range(n_positions)
+        ]
+        for phase, n_tiles in PHASE_N_TILES.items()
+    }
+
+
+def summarise(intervals: list[float]) -> dict[str, float]:
+    return {
+        "n": len(intervals),
+        "mean": fmean(intervals),
+        "median": median(intervals),
+        "min": min(intervals),
+        "max": max(intervals),
+        "stdev": pstdev(intervals),
+    }
+
+
+def measure(
+    name: str, functions: list[Callable[[], object]], repeat: int
+) -> dict[str, float]:
+    """Time every function `repeat` times and summarise the intervals."""
+    timer = Timer(name, no_print=True)
+    for _ in range(repeat):
+        for function in functions:
+            with timer:
+                function()
+
+    return summarise(timer.intervals)
+
+
+def measure_player(
+    player_name: str, options: dict, positions: list[Position], repeat: int, seed: int
+) -> dict[str, float]:
+    """Time the `next_action` of a player on every position, `repeat` times.
+
+    Every repetition uses a new player, so that nothing that a player keeps
+    across turns (like a transposition table) is warm.
+    """
+    timer = Timer(f"{player_name}.next_action", no_print=True)
+    for _ in range(repeat):
+        player = load_player_class(player_name)(Animal, **options)
+        # the players are not part of a game, which would silence them
+        player.verbose = False
+        # a cache of its own, so that players do not warm up each other
+        player.score_cache = ScoreCache()
+        player.use_rng(random.Random(seed))
+
+        for position in positions:
+            with timer:
+                player.next_action(
+                    position.board, position.open_tiles, position.closed_tiles
+                )
+
+    return summarise(timer.intervals)
+
+
+def bench_phase(
+    positions: list[Position],
+    player_options: dict[str, dict],
+    repeat: int,
+    seed: int,
+) -> dict[str, dict[str, float]]:
+    generators = [
+        ActionGenerator(position.board, position.open_tiles, position.closed_tiles)
+        for position in positions
+    ]
+
+    # apply_action is measured on a fixed sample of the actions of every board
+    rng = random.Random(seed)
+    sampled_actions = [
+        (position.board, action)
+        for position, generator in zip(positions, generators)
+        for action in rng.sample(
+            sorted(generator.generate_actions(), key=str),
+            min(20, generator.count_actions()),
+        )
+    ]
+
+    results = {
+        "ActionGenerator.generate_actions": measure(
+            "generate_actions",
+            [generator.generate_actions for generator in generators],
+            repeat,
+        ),
+        "ActionGenerator.generate_encoded_actions": measure(
+            "generate_encoded_actions",
+            [generator.generate_encoded_actions for generator in generators],
+            repeat,
+        ),
+        "Board.apply_action": measure(
+            "apply_action",
+            [
+                lambda board=board, action=action: board.apply_action(action)
+                for board, action in sampled_actions
+            ],
+            repeat,
+        ),
+        "GameScorer.score": measure(
+            "score",
+            [
+                lambda board=position.board: GameScorer(board).score
+                for position in positions
+            ],
+            repeat,
+        ),
+    }
+
+    for player_name, options in player_options.items():
+        results[f"{player_name}.next_action"] = measure_player(
+            player_name, options, positions, repeat, seed
+        )
+
+    return results
+
+
+def run_benchmarks(
+    seed: int = 0,
+    n_positions: int = 5,
+    repeat: int = 3,
+    player_options: dict[str, dict] | None = None,
+) -> dict:
+    """Run all benchmarks and return the results in a JSON serialisable form.
+
+    Args:
+        seed: The seed of the corpus of positions.
+        n_positions: The number of positions of every phase.
+        repeat: How often every measurement is repeated.
+        player_options: The keyword arguments of every player whose
+            `next_action` is measured, see `DEFAULT_PLAYER_OPTIONS`.
+
+    Returns:
+        The settings of the run and the timings in seconds, for every phase
+        and benchmark.
+    """
+    if player_options is None:
+        player_options = DEFAULT_PLAYER_OPTIONS
+
+    corpus = create_corpus(seed, n_positions)
+
+    return {
+        "aiqualin_version": __version__,
+        "python_version": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": seed,
+        "n_positions": n_positions,
+        "repeat": repeat,
+        "player_options": player_options,
+        "results": {
+            phase: bench_phase(positions, player_options, repeat, seed)
+            for phase, positions in corpus.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--n-positions", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--players",
+        nargs="*",
+        default=list(DEFAULT_PLAYER_OPTIONS),
+        help="class names or module.path:ClassName",
+    )
+    parser.add_argument(
+        "--output", default=None, help="file to write to instead of stdout"
+    )
+    args = parser.parse_args()
+
+    player_options = {
+        player_name: DEFAULT_PLAYER_OPTIONS.get(player_name, {})
+        for player_name in args.players
+    }
+    results = run_benchmarks(
+        seed=args.seed,
+        n_positions=args.n_positions,
+        repeat=args.repeat,
+        player_options=player_options,
+    )
+
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
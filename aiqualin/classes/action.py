@@ -57,3 +57,19 @@ class Action:
             placement_col=placement_col,
             placement_tile=Tile(animal=animal, color=color),
         )
+
+    def to_string(self) -> str:
+        animal_index = Animal.to_index(self.placement_tile.animal)
+        color_index = Color.to_index(self.placement_tile.color)
+
+        positions: tuple[int, ...] = (self.placement_row, self.placement_col)
+        if self.move_start_row != -1:
+            positions = (
+                self.move_start_row,
+                self.move_start_col,
+                self.move_end_row,
+                self.move_end_col,
+                *positions,
+            )
+
+        return " ".join(map(str, (*positions, animal_index, color_index)))
@@ -1,14 +1,237 @@
-from collections.abc import Iterable
+import random
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import chain
+from typing import TYPE_CHECKING
 
 from aiqualin.classes.action import Action
-from aiqualin.classes.board import Board
-from aiqualin.classes.tile import EMPTY_TILE, Tile
+from aiqualin.classes.board import N_CELLS, N_GRID, Board
+from aiqualin.classes.compact_board import (
+    CompactBoard,
+    make_encoded_action,
+    unmake_encoded_action,
+)
+from aiqualin.classes.encoded_action import (
+    FIELD_MASK,
+    MOVE_END_SHIFT,
+    MOVE_START_SHIFT,
+    NO_CELL,
+    PLACEMENT_SHIFT,
+    encode_action,
+)
+from aiqualin.classes.move import NO_MOVEMENT, Move
+from aiqualin.classes.symmetry import canonical_key
+from aiqualin.classes.tile import EMPTY_TILE, EMPTY_TILE_CODE, Tile
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (d_col, d_row) of the four directions a tile can slide in
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _ray_mask(cell: int, d_col: int, d_row: int) -> int:
+    row, col = divmod(cell, N_GRID)
+    mask = 0
+    row, col = row + d_row, col + d_col
+    while 0 <= row < N_GRID and 0 <= col < N_GRID:
+        mask |= 1 << (row * N_GRID + col)
+        row, col = row + d_row, col + d_col
+
+    return mask
+
+
+# RAY_MASKS[cell][direction_index] has a bit set for every cell that lies in
+# that direction from the cell, up to the edge of the board
+RAY_MASKS = tuple(
+    tuple(_ray_mask(cell, d_col, d_row) for d_col, d_row in DIRECTIONS)
+    for cell in range(N_CELLS)
+)
+# whether walking along the direction increases the cell index
+DIRECTION_IS_ASCENDING = tuple(d_col + d_row > 0 for d_col, d_row in DIRECTIONS)
+
+
+def reachable_cells_mask(cell: int, direction_index: int, occupancy: int) -> int:
+    """Return the cells a tile can slide to from a cell in one direction.
+
+    Args:
+        cell: The index (``row * 6 + col``) of the cell the tile starts from.
+        direction_index: The index of the direction in `DIRECTIONS`.
+        occupancy: A bitmask of the non-empty cells of the board.
+
+    Returns:
+        A bitmask of the cells that can be reached before hitting another tile
+        or the edge of the board.
+    """
+    ray = RAY_MASKS[cell][direction_index]
+    blockers = ray & occupancy
+    if not blockers:
+        return ray
+
+    if DIRECTION_IS_ASCENDING[direction_index]:
+        # the first tile in the way is the one with the lowest index
+        first_blocker = blockers & -blockers
+        return ray & (first_blocker - 1)
+
+    # the first tile in the way is the one with the highest index
+    return ray & ~((1 << blockers.bit_length()) - 1)
+
+
+def cells_occupancy(cells: bytes | bytearray) -> int:
+    """Return a bitmask with bit ``row * 6 + col`` set for every non-empty cell."""
+    return sum(1 << cell for cell, code in enumerate(cells) if code != EMPTY_TILE_CODE)
+
+
+def occupancy_after_action(occupancy: int, encoded_action: int) -> int:
+    """Return the occupancy bitmask of a board after an encoded action."""
+    move_start_cell = encoded_action >> MOVE_START_SHIFT & FIELD_MASK
+    if move_start_cell != NO_CELL:
+        occupancy ^= 1 << move_start_cell | 1 << (
+            encoded_action >> MOVE_END_SHIFT & FIELD_MASK
+        )
+
+    return occupancy | 1 << (encoded_action >> PLACEMENT_SHIFT & FIELD_MASK)
+
+
+def iter_move_cells(occupancy: int) -> Iterator[tuple[int, int]]:
+    """Yield the start and the end cell of every sliding move of a board.
+
+    Args:
+        occupancy: A bitmask of the non-empty cells of the board.
+    """
+    remaining = occupancy
+    while remaining:
+        lowest_bit = remaining & -remaining
+        remaining ^= lowest_bit
+        cell = lowest_bit.bit_length() - 1
+
+        for direction_index in range(len(DIRECTIONS)):
+            reachable = reachable_cells_mask(cell, direction_index, occupancy)
+            while reachable:
+                lowest_bit = reachable & -reachable
+                reachable ^= lowest_bit
+                yield cell, lowest_bit.bit_length() - 1
+
+
+def placement_cells_after_move(
+    empty_cells: Sequence[int], move_start_cell: int, move_end_cell: int
+) -> tuple[int, ...]:
+    """Return the cells that are empty after a move, `NO_CELL` for not moving.
+
+    The cell that has been moved to is no longer empty and the cell that we
+    moved from becomes empty, it takes the place of the former in the order of
+    `empty_cells`.
+    """
+    return tuple(
+        move_start_cell if cell == move_end_cell else cell for cell in empty_cells
+    )
+
+
+def iter_encoded_placements(
+    empty_cells: Sequence[int],
+    move_cells: Iterable[tuple[int, int]],
+    tile_codes: Sequence[int],
+) -> Iterator[int]:
+    """Lazily yield every move combined with every placement, encoded.
+
+    Every action is yielded exactly once, if the moves are distinct.
+
+    Args:
+        empty_cells: The empty cells of the board before any move.
+        move_cells: The start and end cells of the moves, ``(NO_CELL, NO_CELL)``
+            for not moving.
+        tile_codes: The codes of the open tiles that can be placed.
+    """
+    for move_start_cell, move_end_cell in move_cells:
+        yield from (
+            encode_action(move_start_cell, move_end_cell, placement_cell, tile_code)
+            for placement_cell in placement_cells_after_move(
+                empty_cells, move_start_cell, move_end_cell
+            )
+            for tile_code in tile_codes
+        )
+
+
+def iter_encoded_actions(
+    cells: bytes | bytearray, tile_codes: Sequence[int]
+) -> Iterator[int]:
+    """Lazily yield every action of a board in the integer form of `EncodedAction`.
+
+    The actions without movement come first, followed by the actions of every
+    sliding move. Every action is yielded exactly once.
+
+    Args:
+        cells: The tile codes of the board in row-major order.
+        tile_codes: The codes of the open tiles that can be placed.
+    """
+    occupancy = cells_occupancy(cells)
+    empty_cells = [cell for cell in range(N_CELLS) if not occupancy & (1 << cell)]
+
+    return iter_encoded_placements(
+        empty_cells,
+        chain(((NO_CELL, NO_CELL),), iter_move_cells(occupancy)),
+        tile_codes,
+    )
+
+
+def sample_encoded_action(
+    occupancy: int,
+    tile_codes: Sequence[int],
+    rng: random.Random,
+    move_probability: float = 0.5,
+) -> int:
+    """Draw a random action without generating all the actions of the board.
+
+    With probability `move_probability` a random tile is slid in a random
+    direction, if that tile can move in that direction. Then a random open tile
+    is placed on a random empty cell. Every action can be drawn, but not with
+    equal probability.
+
+    Args:
+        occupancy: A bitmask of the non-empty cells of the board.
+        tile_codes: The codes of the open tiles that can be placed.
+        rng: The random number generator to draw with.
+        move_probability: The probability of trying to slide a tile.
+
+    Returns:
+        The action in the integer form of `EncodedAction`.
+    """
+    random_ = rng.random
+    move_start_cell = move_end_cell = NO_CELL
+
+    if occupancy and random_() < move_probability:
+        cell = int(random_() * N_CELLS)
+        while not occupancy >> cell & 1:
+            cell = int(random_() * N_CELLS)
+
+        reachable = reachable_cells_mask(
+            cell, int(random_() * len(DIRECTIONS)), occupancy
+        )
+        if reachable:
+            # drop a random number of the lowest reachable cells
+            for _ in range(int(random_() * reachable.bit_count())):
+                reachable &= reachable - 1
+
+            move_start_cell = cell
+            move_end_cell = (reachable & -reachable).bit_length() - 1
+            occupancy ^= 1 << move_start_cell | 1 << move_end_cell
+
+    placement_cell = int(random_() * N_CELLS)
+    while occupancy >> placement_cell & 1:
+        placement_cell = int(random_() * N_CELLS)
+
+    return encode_action(
+        move_start_cell,
+        move_end_cell,
+        placement_cell,
+        tile_codes[int(random_() * len(tile_codes))],
+    )
 
 
 @dataclass
 class ActionGenerator:
-    board: Board
+    board: Board | CompactBoard
     open_tiles: list[Tile]
     closed_tiles: list[Tile]
 
@@ -24,137 +247,281 @@ class ActionGenerator:
     def positions_of_empty_tiles(self) -> Iterable[tuple[int, int]]:
         for row_index, row in enumerate(self.board.tiles):
             for col_index, tile in enumerate(row):
-                if tile == EMPTY_TILE:
+                if tile is EMPTY_TILE:
                     yield row_index, col_index
 
     def positions_of_non_empty_tiles(self) -> Iterable[tuple[int, int]]:
         for row_index, row in enumerate(self.board.tiles):
             for col_index, tile in enumerate(row):
-                if tile != EMPTY_TILE:
+                if tile is not EMPTY_TILE:
                     yield row_index, col_index
 
+    @cached_property
+    def occupancy(self) -> int:
+        """A bitmask with bit ``row * 6 + col`` set for every non-empty cell."""
+        return cells_occupancy(self.board.cells)
+
+    @cached_property
+    def empty_cells(self) -> tuple[int, ...]:
+        return tuple(
+            cell for cell in range(N_CELLS) if not self.occupancy & (1 << cell)
+        )
+
+    def iter_moves_in_direction(
+        self, cell: int, direction_index: int
+    ) -> Iterator[Move]:
+        """Lazily yield the moves of the tile on a cell in one direction."""
+        if not self.occupancy & (1 << cell):
+            # trying to find out what happens if we move an empty tile
+            # this is not allowed
+            raise ValueError("Trying to move an empty tile")
+
+        move_start_row, move_start_col = divmod(cell, N_GRID)
+        reachable = reachable_cells_mask(cell, direction_index, self.occupancy)
+        while reachable:
+            lowest_bit = reachable & -reachable
+            reachable ^= lowest_bit
+            move_end_row, move_end_col = divmod(lowest_bit.bit_length() - 1, N_GRID)
+            yield Move(
+                move_start_row=move_start_row,
+                move_start_col=move_start_col,
+                move_end_row=move_end_row,
+                move_end_col=move_end_col,
+            )
+
+    def iter_moves(self) -> Iterator[Move]:
+        """Lazily yield every distinct move, starting with the option of not moving."""
+        yield NO_MOVEMENT
+
+        remaining = self.occupancy
+        while remaining:
+            lowest_bit = remaining & -remaining
+            remaining ^= lowest_bit
+            cell = lowest_bit.bit_length() - 1
+
+            for direction_index in range(len(DIRECTIONS)):
+                yield from self.iter_moves_in_direction(cell, direction_index)
+
+    def iter_actions(self) -> Iterator[Action]:
+        """Lazily yield every action, each of them exactly once.
+
+        Every move is distinct and leaves distinct cells to place a tile on, so
+        the actions are unique by construction and do not have to be collected
+        in a set. They come in the same order as `generate_encoded_actions`.
+        """
+        for move in self.iter_moves():
+            yield from self.generate_placements(move)
+
     def generate_actions_for_position_in_direction(
         self, col: int, row: int, d_col: int, d_row: int, add_no_movement_action: bool
     ) -> set[Action]:
-        actions: set[Action] = set()
+        moves = self.iter_moves_in_direction(
+            row * N_GRID + col, DIRECTIONS.index((d_col, d_row))
+        )
+        if add_no_movement_action:
+            moves = chain((NO_MOVEMENT,), moves)
+
+        return {action for move in moves for action in self.generate_placements(move)}
 
-        assert (d_col, d_row) in [(1, 0), (-1, 0), (0, 1), (0, -1)], (d_col, d_row)
+    def generate_actions_for_position(self, col: int, row: int) -> set[Action]:
+        cell = row * N_GRID + col
+        moves = chain(
+            (NO_MOVEMENT,),
+            *(
+                self.iter_moves_in_direction(cell, direction_index)
+                for direction_index in range(len(DIRECTIONS))
+            ),
+        )
 
-        empty_positions = set(self.positions_of_empty_tiles())
+        return {action for move in moves for action in self.generate_placements(move)}
 
-        if (row, col) in empty_positions:
-            # trying to find out what happens if we move an empty tile
-            # this is not allowed
-            raise ValueError("Trying to move an empty tile")
+    def generate_start_actions(self) -> set[Action]:
+        return set(self.generate_placements(NO_MOVEMENT))
+
+    def generate_actions(self) -> set[Action]:
+        return set(self.iter_actions())
+
+    def generate_moves(self) -> list[Move]:
+        """Return every distinct move, starting with the option of not moving.
+
+        Every action is one of these moves combined with a placement, see
+        `generate_placements`.
+        """
+        return list(self.iter_moves())
 
-        move_tile_col = col
-        move_tile_row = row
-        n_iterations_allowed = 10
-        i = 0
-        while i < n_iterations_allowed:
-            if i > 0:
-                move_tile_col += d_col
-                move_tile_row += d_row
-            i += 1
-
-            # moved out of the board
-            if move_tile_col not in range(len(self.board.tiles)):
-                break
-
-            # moved out of the board
-            if move_tile_row not in range(len(self.board.tiles[move_tile_col])):
-                break
-
-            tile_at_move_position = self.board.tiles[move_tile_row][move_tile_col]
-            if tile_at_move_position != EMPTY_TILE:
-                if (move_tile_row, move_tile_col) == (
-                    row,
-                    col,
-                ):
-                    if add_no_movement_action:
-                        # this is the case where we are not moving a tile
-                        move_kwargs = dict(
-                            move_start_row=-1,
-                            move_start_col=-1,
-                            move_end_row=-1,
-                            move_end_col=-1,
-                        )
-                        # since we do not move the tile, we can place it exactly
-                        # where the empty tiles are currently
-                        empty_tiles_for_placement = set(empty_positions)
-                    else:
-                        continue
-
-                else:
-                    # we found a tile in the way, we can't move further
-                    break
-            else:
-                # we want to both move a tile and place a tile
-                move_kwargs = dict(
-                    move_start_row=row,
-                    move_start_col=col,
-                    move_end_row=move_tile_row,
-                    move_end_col=move_tile_col,
+    def placement_cells(self, move: Move) -> tuple[int, ...]:
+        """Return the cells that are empty after the move has been made."""
+        if move.is_no_movement():
+            return self.empty_cells
+
+        return placement_cells_after_move(
+            self.empty_cells,
+            move.move_start_row * N_GRID + move.move_start_col,
+            move.move_end_row * N_GRID + move.move_end_col,
+        )
+
+    def generate_placements(self, move: Move) -> Iterator[Action]:
+        """Lazily yield every action that combines the move with a placement."""
+        for placement_cell in self.placement_cells(move):
+            placement_row, placement_col = divmod(placement_cell, N_GRID)
+            for new_tile in self.open_tiles:
+                yield Action(
+                    move_start_row=move.move_start_row,
+                    move_start_col=move.move_start_col,
+                    move_end_row=move.move_end_row,
+                    move_end_col=move.move_end_col,
+                    placement_row=placement_row,
+                    placement_col=placement_col,
+                    placement_tile=new_tile,
                 )
-                # remove the tile that has currently been moved to
-                # from the potential empty tiles and add the tile that
-                # we are moving from to the empty tiles
-                empty_tiles_for_placement = (
-                    empty_positions - {(move_tile_row, move_tile_col)}
-                ) | {(row, col)}
-
-            for empty_tile_y, empty_tile_x in empty_tiles_for_placement:
-                for new_tile in self.open_tiles:
-                    new_action = Action(
-                        **move_kwargs,
-                        placement_row=empty_tile_y,
-                        placement_col=empty_tile_x,
-                        placement_tile=new_tile,
-                    )
-                    actions.add(new_action)
-
-        return actions
 
-    def generate_actions_for_position(self, col: int, row: int) -> set[Action]:
-        actions: set[Action] = set()
-
-        for i, (d_col, d_row) in enumerate([(1, 0), (-1, 0), (0, 1), (0, -1)]):
-            add_no_movement_action = i == 0
-            new_actions = self.generate_actions_for_position_in_direction(
-                col=col,
-                row=row,
-                d_col=d_col,
-                d_row=d_row,
-                add_no_movement_action=add_no_movement_action,
+    def generate_encoded_actions(self) -> list[int]:
+        """Return every action in the integer form of `EncodedAction`.
+
+        The actions are unique by construction, the same actions as the ones of
+        `generate_actions` are produced without creating any `Action`.
+        """
+        tile_codes = [tile.code for tile in self.open_tiles]
+
+        return list(iter_encoded_actions(self.board.cells, tile_codes))
+
+    def generate_canonical_encoded_actions(self) -> list[int]:
+        """Return one encoded action for every class of symmetric next positions.
+
+        Actions whose next positions (board and remaining open tiles) only
+        differ by a rotation or reflection of the board or a renaming of the
+        animals or colors are represented by the first of them. This mostly
+        pays off in the opening, where most placements are symmetric to each
+        other.
+        """
+        tile_codes = [tile.code for tile in self.open_tiles]
+        cells = bytearray(self.board.cells)
+
+        canonical_actions = []
+        seen_keys = set()
+        for encoded_action in iter_encoded_actions(self.board.cells, tile_codes):
+            make_encoded_action(cells, encoded_action)
+            placed_tile_code = encoded_action & FIELD_MASK
+            key = canonical_key(
+                cells,
+                [
+                    tile_code
+                    for tile_code in tile_codes
+                    if tile_code != placed_tile_code
+                ],
             )
+            unmake_encoded_action(cells, encoded_action)
 
-            actions |= new_actions
+            if key not in seen_keys:
+                seen_keys.add(key)
+                canonical_actions.append(encoded_action)
 
-        return actions
+        return canonical_actions
 
-    def generate_start_actions(self) -> set[Action]:
-        actions: set[Action] = set()
-        for row, col in self.positions_of_empty_tiles():
-            for tile in self.open_tiles:
-                new_move = Action(
-                    move_start_row=-1,
-                    move_start_col=-1,
-                    move_end_row=-1,
-                    move_end_col=-1,
-                    placement_row=row,
-                    placement_col=col,
-                    placement_tile=tile,
-                )
-                actions.add(new_move)
+    def generate_successor_arrays(
+        self,
+        successors: "np.ndarray | None" = None,
+        encoded_actions: "np.ndarray | None" = None,
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """Write the board after every action into an array, with NumPy.
 
-        return actions
+        The rows are in the order of `generate_encoded_actions`. The successors
+        are written with a handful of vectorised index writes, no object is
+        created per action. The arrays can be scored with
+        `batch_scorer.score_boards`.
 
-    def generate_actions(self) -> set[Action]:
-        if self.board.is_empty():
-            return self.generate_start_actions()
+        Args:
+            successors: A uint8 array with at least `count_actions()` rows of 36
+                cells to write the boards into, a new one is created if None.
+            encoded_actions: An integer array with at least `count_actions()`
+                entries to write the actions into, a new one is created if None.
+
+        Returns:
+            The views of the two arrays with one row for every action.
+
+        Raises:
+            ValueError: If one of the given arrays is too small.
+        """
+        import numpy as np
+
+        cells = np.frombuffer(self.board.cells, dtype=np.uint8)
+        tile_codes = np.array([tile.code for tile in self.open_tiles], dtype=np.int64)
+        empty_cells = np.array(self.empty_cells, dtype=np.int64)
+
+        # the first move is not moving at all
+        move_cells = [(NO_CELL, NO_CELL), *iter_move_cells(self.occupancy)]
+        move_start_cells, move_end_cells = np.array(move_cells, dtype=np.int64).T
+
+        # see `placement_cells_after_move`
+        placement_cells = np.where(
+            empty_cells[None, :] == move_end_cells[:, None],
+            move_start_cells[:, None],
+            empty_cells[None, :],
+        )
+
+        shape = (len(move_cells), len(empty_cells), len(tile_codes))
+        n_actions = shape[0] * shape[1] * shape[2]
+        move_start_cells = np.broadcast_to(move_start_cells[:, None, None], shape)
+        move_end_cells = np.broadcast_to(move_end_cells[:, None, None], shape)
+        placement_cells = np.broadcast_to(placement_cells[:, :, None], shape)
+        tile_codes = np.broadcast_to(tile_codes[None, None, :], shape)
+
+        if successors is None:
+            successors = np.empty((n_actions, N_CELLS), dtype=np.uint8)
+        elif len(successors) < n_actions:
+            raise ValueError(
+                f"successors has {len(successors)} rows, {n_actions} are needed"
+            )
+        if encoded_actions is None:
+            encoded_actions = np.empty(n_actions, dtype=np.int64)
+        elif len(encoded_actions) < n_actions:
+            raise ValueError(
+                f"encoded_actions has {len(encoded_actions)} entries,"
+                f" {n_actions} are needed"
+            )
+        successors = successors[:n_actions]
+        encoded_actions = encoded_actions[:n_actions]
+
+        encoded_actions[:] = (
+            tile_codes
+            | placement_cells << PLACEMENT_SHIFT
+            | move_end_cells << MOVE_END_SHIFT
+            | move_start_cells << MOVE_START_SHIFT
+        ).ravel()
+
+        successors[:] = cells
+        rows = np.arange(n_actions)
+        # the rows of the actions without movement come first
+        n_rows_without_movement = shape[1] * shape[2]
+        moving_rows = rows[n_rows_without_movement:]
+        moving_start_cells = move_start_cells.ravel()[n_rows_without_movement:]
+        moving_end_cells = move_end_cells.ravel()[n_rows_without_movement:]
+        successors[moving_rows, moving_end_cells] = cells[moving_start_cells]
+        successors[moving_rows, moving_start_cells] = EMPTY_TILE_CODE
+        successors[rows, placement_cells.ravel()] = tile_codes.ravel()
+
+        return successors, encoded_actions
+
+    def count_moves(self) -> int:
+        occupancy = self.occupancy
+        n_moves = 1  # not moving at all
+        remaining = occupancy
+        while remaining:
+            lowest_bit = remaining & -remaining
+            remaining ^= lowest_bit
+            cell = lowest_bit.bit_length() - 1
+
+            for direction_index in range(len(DIRECTIONS)):
+                n_moves += reachable_cells_mask(
+                    cell, direction_index, occupancy
+                ).bit_count()
+
+        return n_moves
 
-        moves: set[Action] = set()
-        for row, col in self.positions_of_non_empty_tiles():
-            moves |= self.generate_actions_for_position(col=col, row=row)
+    def count_actions(self) -> int:
+        """Count the actions without generating them.
 
-        return moves
+        Every move leaves the same number of empty cells to place a tile on, so
+        the number of actions is a product of three counts.
+        """
+        return self.count_moves() * len(self.empty_cells) * len(self.open_tiles)
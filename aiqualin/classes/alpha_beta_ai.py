@@ -0,0 +1,369 @@
+from functools import cached_property
+from itertools import chain
+from time import perf_counter
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import iter_encoded_actions
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import (
+    CompactBoard,
+    make_encoded_action,
+    unmake_encoded_action,
+)
+from aiqualin.classes.encoded_action import FIELD_MASK, EncodedAction
+from aiqualin.classes.game_scorer import encoded_action_delta
+from aiqualin.classes.player import AbstractPlayer
+from aiqualin.classes.symmetry import canonical_key
+from aiqualin.classes.tile import Tile
+from aiqualin.classes.transposition_table import Bound, TranspositionTable
+from aiqualin.classes.zobrist import (
+    COLOR_TO_MOVE_KEY,
+    OPEN_TILE_KEYS,
+    encoded_action_key_delta,
+    tile_codes_key,
+    zobrist_key,
+)
+
+INFINITY = 1_000_000
+
+
+def remove_tile_code(tile_codes: tuple[int, ...], tile_code: int) -> tuple[int, ...]:
+    return tuple(code for code in tile_codes if code != tile_code)
+
+
+class AlphaBetaAI(AbstractPlayer):
+    """
+    A player that searches the moves of both sides with depth-limited negamax
+    and alpha-beta pruning.
+
+    Positions are evaluated by the score lead of the side to move, which is
+    updated incrementally with the score delta of every action. Moves are
+    ordered by their one-ply score delta, and only the `max_branching` best
+    ones are searched at every node. The board is changed in place while
+    searching (make/unmake) instead of being copied.
+
+    Tiles that would be drawn from the closed tiles during the search are not
+    known, so the search only places the tiles that are currently open.
+
+    Search results are stored in a transposition table keyed by the Zobrist key
+    of the position, so positions reached through different move orders, in
+    the same turn or in a later one, are not searched again.
+    """
+
+    def __init__(
+        self,
+        side: type[Animal | Color],
+        depth: int | None = 2,
+        max_branching: int | None = 20,
+        time_budget: float | None = None,
+        transposition_table: TranspositionTable | None = None,
+        use_symmetry: bool = True,
+    ) -> None:
+        """
+        Args:
+            side: The side the player plays for.
+            depth: The number of plies to search, until no open tiles are left
+                if None.
+            max_branching: The number of best ordered actions that are searched at
+                every node, all actions are searched if None.
+            time_budget: The number of seconds after which no more moves are
+                searched at the root, the best move found so far is returned.
+            transposition_table: The table search results are stored in, they
+                are kept across turns. A new table is created if None.
+            use_symmetry: Whether only one of the children of a node that are
+                symmetric to each other is searched, see `canonical_key`.
+        """
+        super().__init__(side)
+
+        assert depth is None or depth >= 1, "depth must be at least 1"
+
+        self.depth = depth
+        self.max_branching = max_branching
+        self.time_budget = time_budget
+        self.use_symmetry = use_symmetry
+        if transposition_table is not None:
+            self.transposition_table = transposition_table
+
+        self.n_nodes_searched = 0
+
+    @cached_property
+    def transposition_table(self) -> TranspositionTable:
+        # created on first use, so that subclasses that search without it
+        # do not allocate one
+        return TranspositionTable()
+
+    def mover_delta(self, cells: bytearray, encoded_action: int, sign: int) -> int:
+        # sign is 1 if the side to move plays for animals and -1 otherwise
+        delta_animal, delta_color = encoded_action_delta(cells, encoded_action)
+        return sign * (delta_animal - delta_color)
+
+    def ordered_children(
+        self, cells: bytearray, tile_codes: tuple[int, ...], lead: int, sign: int
+    ) -> list[tuple[int, int]]:
+        """Return the (lead after the action, action) pairs of the best actions.
+
+        The pairs are sorted from the best to the worst action for the side to
+        move and cut off after `max_branching` actions. If `use_symmetry` is
+        set, actions that lead to a position that is symmetric to the position
+        of a better action are left out.
+        """
+        children = sorted(
+            (
+                (lead + self.mover_delta(cells, encoded_action, sign), encoded_action)
+                for encoded_action in iter_encoded_actions(cells, tile_codes)
+            ),
+            key=lambda child: (-child[0], child[1]),
+        )
+
+        if not self.use_symmetry:
+            return children[: self.max_branching]
+
+        # symmetric positions have the same value, so only the first of them
+        # has to be searched
+        unique_children = []
+        seen_keys = set()
+        for child in children:
+            if (
+                self.max_branching is not None
+                and len(unique_children) >= self.max_branching
+            ):
+                break
+
+            encoded_action = child[1]
+            make_encoded_action(cells, encoded_action)
+            key = canonical_key(
+                cells, remove_tile_code(tile_codes, encoded_action & FIELD_MASK)
+            )
+            unmake_encoded_action(cells, encoded_action)
+
+            if key not in seen_keys:
+                seen_keys.add(key)
+                unique_children.append(child)
+
+        return unique_children
+
+    def search_depth(self, tile_codes: tuple[int, ...]) -> int:
+        # only the open tiles are placed during the search, so searching
+        # deeper than their number does not change the result
+        if self.depth is None:
+            return len(tile_codes)
+
+        return min(self.depth, len(tile_codes))
+
+    def root_position(
+        self, board: Board, open_tiles: list[Tile]
+    ) -> tuple[bytearray, tuple[int, ...], int, int, int, list[tuple[int, int]]]:
+        """Return everything a search needs to know about the position of a turn.
+
+        Returns:
+            The cells of the board, the codes of the open tiles, the sign (1 if
+            we play for animals and -1 otherwise), our score lead, the Zobrist
+            key of the position and its ordered children, see
+            `ordered_children`.
+        """
+        cells = bytearray(CompactBoard.from_board(board).cells)
+        tile_codes = tuple(tile.code for tile in open_tiles)
+
+        sign = 1 if self.our_side == Animal else -1
+        score_animal, score_color = self.score_cache.scores(cells)
+        lead = sign * (score_animal - score_color)
+        key = self.position_key(cells, tile_codes, sign)
+
+        children = self.ordered_children(cells, tile_codes, lead, sign)
+
+        return cells, tile_codes, sign, lead, key, children
+
+    def position_key(
+        self, cells: bytes | bytearray, tile_codes: tuple[int, ...], sign: int
+    ) -> int:
+        key = zobrist_key(cells) ^ tile_codes_key(tile_codes)
+        return key if sign == 1 else key ^ COLOR_TO_MOVE_KEY
+
+    def child_key(self, key: int, cells: bytearray, encoded_action: int) -> int:
+        # the action changes the board, uses up the placed tile and passes the
+        # turn to the other side
+        return (
+            key
+            ^ encoded_action_key_delta(cells, encoded_action)
+            ^ OPEN_TILE_KEYS[encoded_action & FIELD_MASK]
+            ^ COLOR_TO_MOVE_KEY
+        )
+
+    def negamax(
+        self,
+        cells: bytearray,
+        tile_codes: tuple[int, ...],
+        lead: int,
+        sign: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+        key: int,
+    ) -> int:
+        """Return the value of a position for the side to move.
+
+        Args:
+            cells: The cells of the board, restored before returning.
+            tile_codes: The codes of the tiles that can be placed.
+            lead: The score lead of the side to move.
+            sign: 1 if the side to move plays for animals and -1 otherwise.
+            depth: The number of plies left to search.
+            alpha: The value the side to move is already guaranteed.
+            beta: The value the opponent is already guaranteed, negated.
+            key: The Zobrist key of the position, see `position_key`.
+        """
+        self.n_nodes_searched += 1
+
+        if depth == 0 or len(tile_codes) == 0:
+            return lead
+
+        original_alpha = alpha
+        best_action = None
+        entry = self.transposition_table.get(key)
+        if entry is not None:
+            best_action = entry.best_action
+            if entry.depth >= depth:
+                if entry.bound is Bound.EXACT:
+                    return entry.value
+                if entry.bound is Bound.LOWER:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value
+
+        if depth == 1:
+            # the leaves do not need to be ordered, we can stop as soon as one
+            # action refutes the move of the opponent
+            best_value = -INFINITY
+            encoded_actions = iter_encoded_actions(cells, tile_codes)
+            if best_action is not None:
+                encoded_actions = chain((best_action,), encoded_actions)
+            for encoded_action in encoded_actions:
+                value = lead + self.mover_delta(cells, encoded_action, sign)
+                if value > best_value:
+                    best_value = value
+                    best_action = encoded_action
+                    if best_value >= beta:
+                        break
+
+            if best_value == -INFINITY:
+                return lead
+        else:
+            children = self.ordered_children(cells, tile_codes, lead, sign)
+            if len(children) == 0:
+                return lead
+
+            if best_action is not None:
+                # search the best action of an earlier search first
+                children = [
+                    (lead + self.mover_delta(cells, best_action, sign), best_action)
+                ] + [child for child in children if child[1] != best_action]
+
+            best_value = -INFINITY
+            for child_lead, encoded_action in children:
+                child_key = self.child_key(key, cells, encoded_action)
+                make_encoded_action(cells, encoded_action)
+                value = -self.negamax(
+                    cells,
+                    remove_tile_code(tile_codes, encoded_action & FIELD_MASK),
+                    -child_lead,
+                    -sign,
+                    depth - 1,
+                    -beta,
+                    -alpha,
+                    child_key,
+                )
+                unmake_encoded_action(cells, encoded_action)
+
+                if value > best_value:
+                    best_value = value
+                    best_action = encoded_action
+                    alpha = max(alpha, value)
+                    if alpha >= beta:
+                        break
+
+        if best_value <= original_alpha:
+            bound = Bound.UPPER
+        elif best_value >= beta:
+            bound = Bound.LOWER
+        else:
+            bound = Bound.EXACT
+        self.transposition_table.store(key, depth, best_value, bound, best_action)
+
+        return best_value
+
+    def search_root(
+        self,
+        cells: bytearray,
+        tile_codes: tuple[int, ...],
+        children: list[tuple[int, int]],
+        sign: int,
+        key: int,
+        depth: int,
+        deadline: float | None = None,
+    ) -> tuple[int, int]:
+        """Return the best value and action among the children of the root.
+
+        Args:
+            cells: The cells of the board, restored before returning.
+            tile_codes: The codes of the tiles that can be placed.
+            children: The (lead after the action, action) pairs to search, in
+                the order in which they are searched.
+            sign: 1 if we play for animals and -1 otherwise.
+            key: The Zobrist key of the root, see `position_key`.
+            depth: The number of plies to search, including the root.
+            deadline: The `perf_counter` time after which no more children
+                are searched.
+        """
+        best_value = -INFINITY
+        best_action = children[0][1]
+        for child_lead, encoded_action in children:
+            if deadline is not None and perf_counter() > deadline:
+                break
+
+            child_key = self.child_key(key, cells, encoded_action)
+            make_encoded_action(cells, encoded_action)
+            value = -self.negamax(
+                cells,
+                remove_tile_code(tile_codes, encoded_action & FIELD_MASK),
+                -child_lead,
+                -sign,
+                depth - 1,
+                -INFINITY,
+                -best_value,
+                child_key,
+            )
+            unmake_encoded_action(cells, encoded_action)
+
+            if value > best_value:
+                best_value = value
+                best_action = encoded_action
+
+        return best_value, best_action
+
+    def next_action(
+        self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
+    ) -> Action:
+        start_time = perf_counter()
+        self.n_nodes_searched = 0
+
+        cells, tile_codes, sign, _, key, children = self.root_position(
+            board, open_tiles
+        )
+
+        _, best_action = self.search_root(
+            cells,
+            tile_codes,
+            children,
+            sign,
+            key,
+            self.search_depth(tile_codes),
+            deadline=(
+                start_time + self.time_budget if self.time_budget is not None else None
+            ),
+        )
+
+        return EncodedAction(best_action).to_action()
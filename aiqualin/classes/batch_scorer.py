@@ -0,0 +1,123 @@
+"""
+Score many boards at once with NumPy.
+
+NumPy is an optional dependency (``pip install aiqualin[numpy]``), so this
+module is only imported by code that scores boards in batches.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from aiqualin.classes.board import N_CELLS, N_GRID
+from aiqualin.classes.game_scorer import LENGTH_TO_SCORE_MAP, N_COLOR_CODES
+from aiqualin.classes.tile import EMPTY_TILE_CODE
+
+# the label of the empty cells, larger than the label of any component
+_NO_LABEL = N_CELLS
+
+# _SCORE_OF_SIZE[size] is the score of a component with `size` tiles
+_SCORE_OF_SIZE = np.zeros(N_CELLS + 2, dtype=np.int64)
+for _size, _score in LENGTH_TO_SCORE_MAP.items():
+    _SCORE_OF_SIZE[_size] = _score
+
+
+def cells_to_array(cells: Iterable[bytes | bytearray]) -> np.ndarray:
+    """Stack the cells of many boards into an (N, 6, 6) uint8 array."""
+    return np.frombuffer(b"".join(cells), dtype=np.uint8).reshape(-1, N_GRID, N_GRID)
+
+
+def _label_components(properties: np.ndarray, occupied: np.ndarray) -> np.ndarray:
+    # every tile starts with its own cell index as label, and takes the
+    # smallest label of its neighbors with the same property until nothing
+    # changes, so every component ends up labelled with its smallest cell
+    n_boards = len(properties)
+
+    joins_right = (
+        occupied[:, :, :-1]
+        & occupied[:, :, 1:]
+        & (properties[:, :, :-1] == properties[:, :, 1:])
+    )
+    joins_down = (
+        occupied[:, :-1, :]
+        & occupied[:, 1:, :]
+        & (properties[:, :-1, :] == properties[:, 1:, :])
+    )
+
+    labels = np.where(
+        occupied, np.arange(N_CELLS, dtype=np.intp).reshape(N_GRID, N_GRID), _NO_LABEL
+    )
+
+    while True:
+        new_labels = labels.copy()
+        np.minimum(
+            new_labels[:, :, :-1],
+            np.where(joins_right, labels[:, :, 1:], _NO_LABEL),
+            out=new_labels[:, :, :-1],
+        )
+        np.minimum(
+            new_labels[:, :, 1:],
+            np.where(joins_right, labels[:, :, :-1], _NO_LABEL),
+            out=new_labels[:, :, 1:],
+        )
+        np.minimum(
+            new_labels[:, :-1, :],
+            np.where(joins_down, labels[:, 1:, :], _NO_LABEL),
+            out=new_labels[:, :-1, :],
+        )
+        np.minimum(
+            new_labels[:, 1:, :],
+            np.where(joins_down, labels[:, :-1, :], _NO_LABEL),
+            out=new_labels[:, 1:, :],
+        )
+
+        # pointer jumping: a tile takes the label of the cell its label points
+        # to, which is in the same component and has a label that is at most
+        # as large
+        flat_labels = new_labels.reshape(n_boards, N_CELLS)
+        padded_labels = np.concatenate(
+            (flat_labels, np.full((n_boards, 1), _NO_LABEL)), axis=1
+        )
+        flat_labels = np.take_along_axis(padded_labels, flat_labels, axis=1)
+        new_labels = flat_labels.reshape(n_boards, N_GRID, N_GRID)
+
+        if np.array_equal(new_labels, labels):
+            return labels.reshape(n_boards, N_CELLS)
+
+        labels = new_labels
+
+
+def _score_properties(properties: np.ndarray, occupied: np.ndarray) -> np.ndarray:
+    n_boards = len(properties)
+    labels = _label_components(properties, occupied)
+
+    # count the tiles of every label of every board with a single bincount
+    offsets = np.arange(n_boards, dtype=np.int64)[:, None] * (N_CELLS + 1)
+    component_sizes = np.bincount(
+        (labels + offsets).ravel(), minlength=n_boards * (N_CELLS + 1)
+    ).reshape(n_boards, N_CELLS + 1)
+    component_sizes[:, _NO_LABEL] = 0
+
+    return _SCORE_OF_SIZE[component_sizes].sum(axis=1)
+
+
+def score_boards(boards: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the animal and the color scores of many boards at once.
+
+    Args:
+        boards: An (N, 6, 6) or (N, 36) array with the tile codes of N boards,
+            as stored in `CompactBoard.cells`, see `cells_to_array`.
+
+    Returns:
+        Two arrays of length N with the animal and the color scores.
+    """
+    codes = np.asarray(boards, dtype=np.uint8).reshape(-1, N_GRID, N_GRID)
+    occupied = codes != EMPTY_TILE_CODE
+
+    # the animals and the colors are labelled in a single batch of 2N boards
+    scores = _score_properties(
+        np.concatenate((codes // N_COLOR_CODES, codes % N_COLOR_CODES)),
+        np.concatenate((occupied, occupied)),
+    )
+
+    return scores[: len(codes)], scores[len(codes) :]
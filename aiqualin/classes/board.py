@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
 
 from rich import print
@@ -11,13 +10,17 @@ from aiqualin.classes.animal import Animal
 from aiqualin.classes.color import Color
 from aiqualin.classes.tile import EMPTY_TILE, Tile
 
+N_GRID = 6
+N_CELLS = N_GRID * N_GRID
+
 
 @dataclass(frozen=True)
 class Board:
     tiles: list[list[Tile]]
 
     def apply_action(self, action: Action) -> Board:
-        tiles = copy.deepcopy(self.tiles)
+        # tiles are immutable and shared, only the rows have to be copied
+        tiles = [row.copy() for row in self.tiles]
 
         move_coordinates = (
             action.move_start_row,
@@ -34,7 +37,7 @@ class Board:
         else:
             # make sure that the tile at the start is not empty
             tile_at_start = tiles[action.move_start_row][action.move_start_col]
-            assert tile_at_start != EMPTY_TILE, "cannot move from empty tile"
+            assert tile_at_start is not EMPTY_TILE, "cannot move from empty tile"
 
             # make start tile empty
             tiles[action.move_start_row][action.move_start_col] = EMPTY_TILE
@@ -45,7 +48,7 @@ class Board:
         try:
             tile_at_placement = tiles[action.placement_row][action.placement_col]
             assert (
-                tile_at_placement == EMPTY_TILE
+                tile_at_placement is EMPTY_TILE
             ), "cannot place tile on non-empty tile"
             tiles[action.placement_row][action.placement_col] = action.placement_tile
         except AssertionError:
@@ -60,10 +63,9 @@ class Board:
 
     @classmethod
     def empty_board(cls) -> Self:
-        n_grid = 6
         tiles = [
-            [Tile(animal=Animal.EMPTY, color=Color.EMPTY) for _ in range(n_grid)]
-            for _ in range(n_grid)
+            [Tile(animal=Animal.EMPTY, color=Color.EMPTY) for _ in range(N_GRID)]
+            for _ in range(N_GRID)
         ]
 
         board = cls(tiles=tiles)
@@ -98,5 +100,10 @@ class Board:
 
         return cls(tiles=tiles)
 
+    @property
+    def cells(self) -> bytes:
+        """The tile codes of all cells in row-major order."""
+        return bytes(tile.code for row in self.tiles for tile in row)
+
     def is_empty(self) -> bool:
-        return all(tile == EMPTY_TILE for row in self.tiles for tile in row)
+        return all(tile is EMPTY_TILE for row in self.tiles for tile in row)
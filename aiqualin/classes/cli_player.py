@@ -1,6 +1,8 @@
 from aiqualin.classes.action import Action
-from aiqualin.classes.action_generator import ActionGenerator
 from aiqualin.classes.board import Board
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.encoded_action import EncodedAction
+from aiqualin.classes.game_scorer import GameScorer
 from aiqualin.classes.player import AbstractPlayer
 from aiqualin.classes.tile import Tile
 
@@ -11,8 +13,7 @@ class CLIPlayer(AbstractPlayer):
     ) -> Action:
         print()
 
-        our_score = self.our_score(board)
-        their_score = self.their_score(board)
+        our_score, their_score = self.side_scores(board)
 
         our_side_str = f"{self.our_side.__name__.title()}"
         their_side_str = f"{self.their_side.__name__.title()}"
@@ -33,9 +34,7 @@ class CLIPlayer(AbstractPlayer):
 
         action_str = input("Enter action: ")
 
-        all_possible_actions = ActionGenerator(
-            board, open_tiles, closed_tiles
-        ).generate_actions()
+        all_possible_actions = set(self.encoded_actions(board, open_tiles))
         while True:
             while True:
                 try:
@@ -54,7 +53,7 @@ class CLIPlayer(AbstractPlayer):
                     action_str = input("Invalid input. Try again: ")
                     continue
 
-            if action in all_possible_actions:
+            if EncodedAction.from_action(action) in all_possible_actions:
                 break
 
             action_str = input("Invalid action. Try again: ")
@@ -71,13 +70,18 @@ class CLIPlayerWithBestMoveSuggestion(CLIPlayer):
         """
         Prints the move that would currently give the highest score difference. Then prompts the user to enter their move.
         """
-        actions = ActionGenerator(board, open_tiles, closed_tiles).generate_actions()
-
-        best_action = max(
-            actions,
-            key=lambda action: self.our_score(board.apply_action(action))
-            - self.their_score(board.apply_action(action)),
-        )
+        # the list is cached, so `CLIPlayer.next_action` gets it for free
+        actions = self.encoded_actions(board, open_tiles)
+
+        # the score difference of the current board is the same for every
+        # action, only the change caused by the action matters
+        scorer = GameScorer(CompactBoard.from_board(board))
+        best_action = EncodedAction(
+            max(
+                actions,
+                key=lambda action: self.our_delta(scorer.encoded_delta(action)),
+            )
+        ).to_action()
 
         print("Best move:", best_action)
 
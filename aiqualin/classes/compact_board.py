@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from rich import print
+from typing_extensions import Self
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.board import N_CELLS, N_GRID, Board
+from aiqualin.classes.encoded_action import (
+    FIELD_MASK,
+    MOVE_END_SHIFT,
+    MOVE_START_SHIFT,
+    NO_CELL,
+    PLACEMENT_SHIFT,
+)
+from aiqualin.classes.tile import EMPTY_TILE_CODE, Tile
+from aiqualin.classes.zobrist import CELL_KEYS, encoded_action_key_delta, zobrist_key
+
+
+def make_encoded_action(cells: bytearray, encoded_action: int) -> None:
+    """Apply an encoded action to the cells of a board in place."""
+    move_start_cell = encoded_action >> MOVE_START_SHIFT & FIELD_MASK
+    if move_start_cell != NO_CELL:
+        move_end_cell = encoded_action >> MOVE_END_SHIFT & FIELD_MASK
+        cells[move_end_cell] = cells[move_start_cell]
+        cells[move_start_cell] = EMPTY_TILE_CODE
+
+    cells[encoded_action >> PLACEMENT_SHIFT & FIELD_MASK] = encoded_action & FIELD_MASK
+
+
+def unmake_encoded_action(cells: bytearray, encoded_action: int) -> None:
+    """Undo `make_encoded_action` on the cells of a board in place."""
+    cells[encoded_action >> PLACEMENT_SHIFT & FIELD_MASK] = EMPTY_TILE_CODE
+
+    move_start_cell = encoded_action >> MOVE_START_SHIFT & FIELD_MASK
+    if move_start_cell != NO_CELL:
+        move_end_cell = encoded_action >> MOVE_END_SHIFT & FIELD_MASK
+        cells[move_start_cell] = cells[move_end_cell]
+        cells[move_end_cell] = EMPTY_TILE_CODE
+
+
+@dataclass(frozen=True)
+class CompactBoard:
+    """
+    An immutable board that stores every cell as a single byte.
+
+    Cell ``row * 6 + col`` holds the ``Tile.code`` of the tile that is placed
+    there, so copying a board is a single copy of a 36 byte buffer.
+
+    The Zobrist key of the board is computed once and then updated
+    incrementally by every applied action.
+    """
+
+    cells: bytes
+    zobrist_key: int | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        assert len(self.cells) == N_CELLS, f"a board must have {N_CELLS} cells"
+
+        if self.zobrist_key is None:
+            object.__setattr__(self, "zobrist_key", zobrist_key(self.cells))
+
+    @cached_property
+    def tiles(self) -> tuple[tuple[Tile, ...], ...]:
+        return tuple(
+            tuple(
+                Tile.from_code(code)
+                for code in self.cells[row_index * N_GRID : (row_index + 1) * N_GRID]
+            )
+            for row_index in range(N_GRID)
+        )
+
+    def apply_action(self, action: Action) -> CompactBoard:
+        cells = bytearray(self.cells)
+        key = self.zobrist_key
+
+        move_coordinates = (
+            action.move_start_row,
+            action.move_start_col,
+            action.move_end_row,
+            action.move_end_col,
+        )
+
+        if all(coordinate == -1 for coordinate in move_coordinates):
+            # this is an action without movement
+            pass
+        elif -1 in move_coordinates:
+            raise ValueError("cannot have partial move")
+        else:
+            move_start = action.move_start_row * N_GRID + action.move_start_col
+            move_end = action.move_end_row * N_GRID + action.move_end_col
+
+            # make sure that the tile at the start is not empty
+            code_at_start = cells[move_start]
+            assert code_at_start != EMPTY_TILE_CODE, "cannot move from empty tile"
+
+            cells[move_start] = EMPTY_TILE_CODE
+            cells[move_end] = code_at_start
+            key ^= CELL_KEYS[move_start][code_at_start]
+            key ^= CELL_KEYS[move_end][code_at_start]
+
+        # place tile
+        placement = action.placement_row * N_GRID + action.placement_col
+        try:
+            assert (
+                cells[placement] == EMPTY_TILE_CODE
+            ), "cannot place tile on non-empty tile"
+        except AssertionError:
+            print()
+            self.visualize()
+            print()
+            print(action)
+            print()
+            raise
+        cells[placement] = action.placement_tile.code
+        key ^= CELL_KEYS[placement][cells[placement]]
+
+        return CompactBoard(cells=bytes(cells), zobrist_key=key)
+
+    def apply_encoded_action(self, encoded_action: int) -> CompactBoard:
+        """Apply an action in the integer form of `EncodedAction`."""
+        cells = bytearray(self.cells)
+
+        move_start_cell = encoded_action >> MOVE_START_SHIFT & FIELD_MASK
+        if move_start_cell != NO_CELL:
+            move_end_cell = encoded_action >> MOVE_END_SHIFT & FIELD_MASK
+            assert (
+                cells[move_start_cell] != EMPTY_TILE_CODE
+            ), "cannot move from empty tile"
+
+            cells[move_end_cell] = cells[move_start_cell]
+            cells[move_start_cell] = EMPTY_TILE_CODE
+
+        placement_cell = encoded_action >> PLACEMENT_SHIFT & FIELD_MASK
+        assert (
+            cells[placement_cell] == EMPTY_TILE_CODE
+        ), "cannot place tile on non-empty tile"
+        cells[placement_cell] = encoded_action & FIELD_MASK
+
+        return CompactBoard(
+            cells=bytes(cells),
+            zobrist_key=self.zobrist_key
+            ^ encoded_action_key_delta(self.cells, encoded_action),
+        )
+
+    @classmethod
+    def empty_board(cls) -> Self:
+        return cls(cells=bytes([EMPTY_TILE_CODE]) * N_CELLS)
+
+    @classmethod
+    def from_board(cls, board: Board | CompactBoard) -> Self:
+        if isinstance(board, cls):
+            return board
+
+        return cls(cells=board.cells)
+
+    def to_board(self) -> Board:
+        return Board(tiles=[list(row) for row in self.tiles])
+
+    def visualize(self) -> None:
+        rows = []
+        for row in self.tiles:
+            rows += [" ".join(tile.short_string() for tile in row)]
+
+        print("\n".join(rows))
+
+    @classmethod
+    def from_pretty_string(cls, pretty_string: str) -> Self:
+        codes = [
+            Tile.from_short_string(tile_string).code
+            for row in pretty_string.splitlines()
+            for tile_string in row.strip().split(" ")
+        ]
+
+        return cls(cells=bytes(codes))
+
+    def is_empty(self) -> bool:
+        return self.cells.count(EMPTY_TILE_CODE) == N_CELLS
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing_extensions import Self
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.board import N_GRID
+from aiqualin.classes.tile import Tile
+
+FIELD_BITS = 6
+FIELD_MASK = (1 << FIELD_BITS) - 1
+
+PLACEMENT_SHIFT = FIELD_BITS
+MOVE_END_SHIFT = 2 * FIELD_BITS
+MOVE_START_SHIFT = 3 * FIELD_BITS
+
+# the move cells of an action without movement
+NO_CELL = FIELD_MASK
+
+
+def encode_action(
+    move_start_cell: int, move_end_cell: int, placement_cell: int, tile_code: int
+) -> int:
+    """Pack an action given as cell indices and a tile code into an int.
+
+    Args:
+        move_start_cell: The cell the moved tile starts from, `NO_CELL` if no
+            tile is moved.
+        move_end_cell: The cell the moved tile ends on, `NO_CELL` if no tile is
+            moved.
+        placement_cell: The cell the new tile is placed on.
+        tile_code: The `Tile.code` of the placed tile.
+
+    Returns:
+        The encoded action.
+    """
+    return (
+        move_start_cell << MOVE_START_SHIFT
+        | move_end_cell << MOVE_END_SHIFT
+        | placement_cell << PLACEMENT_SHIFT
+        | tile_code
+    )
+
+
+class EncodedAction(int):
+    """
+    An action packed into a single integer.
+
+    Bits 0-5 hold the code of the placed tile, bits 6-11 the placement cell,
+    bits 12-17 the cell the moved tile ends on and bits 18-23 the cell it
+    starts from. Hashing and comparing encoded actions is as cheap as it is for
+    any int, and plain ints produced by `encode_action` can be used wherever an
+    encoded action is expected.
+    """
+
+    __slots__ = ()
+
+    @property
+    def move_start_cell(self) -> int:
+        return self >> MOVE_START_SHIFT & FIELD_MASK
+
+    @property
+    def move_end_cell(self) -> int:
+        return self >> MOVE_END_SHIFT & FIELD_MASK
+
+    @property
+    def placement_cell(self) -> int:
+        return self >> PLACEMENT_SHIFT & FIELD_MASK
+
+    @property
+    def tile_code(self) -> int:
+        return self & FIELD_MASK
+
+    def has_movement(self) -> bool:
+        return self.move_start_cell != NO_CELL
+
+    @classmethod
+    def from_action(cls, action: Action) -> Self:
+        if action.move_start_row == -1:
+            move_start_cell = move_end_cell = NO_CELL
+        else:
+            move_start_cell = action.move_start_row * N_GRID + action.move_start_col
+            move_end_cell = action.move_end_row * N_GRID + action.move_end_col
+
+        return cls(
+            encode_action(
+                move_start_cell=move_start_cell,
+                move_end_cell=move_end_cell,
+                placement_cell=action.placement_row * N_GRID + action.placement_col,
+                tile_code=action.placement_tile.code,
+            )
+        )
+
+    def to_action(self) -> Action:
+        if self.has_movement():
+            move_start_row, move_start_col = divmod(self.move_start_cell, N_GRID)
+            move_end_row, move_end_col = divmod(self.move_end_cell, N_GRID)
+        else:
+            move_start_row = move_start_col = move_end_row = move_end_col = -1
+
+        placement_row, placement_col = divmod(self.placement_cell, N_GRID)
+
+        return Action(
+            move_start_row=move_start_row,
+            move_start_col=move_start_col,
+            move_end_row=move_end_row,
+            move_end_col=move_end_col,
+            placement_row=placement_row,
+            placement_col=placement_col,
+            placement_tile=Tile.from_code(self.tile_code),
+        )
+
+    @classmethod
+    def from_string(cls, string: str) -> Self:
+        return cls.from_action(Action.from_string(string))
+
+    def to_string(self) -> str:
+        return self.to_action().to_string()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_string()!r})"
+
+
+__all__ = ["EncodedAction", "encode_action", "NO_CELL"]
@@ -0,0 +1,218 @@
+import random
+from statistics import fmean
+from time import perf_counter
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import iter_encoded_actions
+from aiqualin.classes.alpha_beta_ai import INFINITY, AlphaBetaAI, remove_tile_code
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import make_encoded_action, unmake_encoded_action
+from aiqualin.classes.encoded_action import FIELD_MASK, EncodedAction
+from aiqualin.classes.tile import Tile
+
+
+class ExpectimaxAI(AlphaBetaAI):
+    """
+    A search player that models the tile that refills the open tiles after
+    every action as a chance node over the closed tiles.
+
+    At most `n_samples` of the closed tiles are drawn at every chance node and
+    the values of the positions they lead to are averaged. Values of positions
+    are memoised for the whole turn, so subtrees that are reached through
+    different draws or move orders are only searched once. For the last ply the
+    best action of every tile is computed once and shared by all draws, since a
+    draw only adds one tile to the tiles that are already open.
+    """
+
+    def __init__(
+        self,
+        side: type[Animal | Color],
+        depth: int = 2,
+        max_branching: int | None = 10,
+        n_samples: int = 3,
+        time_budget: float | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Args:
+            side: The side the player plays for.
+            depth: The number of plies to search.
+            max_branching: The number of best ordered actions that are searched at
+                every node, all actions are searched if None.
+            n_samples: The maximum number of closed tiles drawn at a chance node.
+            time_budget: The number of seconds after which no more moves are
+                searched at the root, the best move found so far is returned.
+            rng: The random number generator used to sample the draws.
+        """
+        # the closed tiles are not renamed with the board, so positions with
+        # the same canonical key can have different draws
+        super().__init__(
+            side,
+            depth=depth,
+            max_branching=max_branching,
+            time_budget=time_budget,
+            use_symmetry=False,
+        )
+
+        assert n_samples >= 1, "n_samples must be at least 1"
+
+        self.n_samples = n_samples
+        self.rng = rng if rng is not None else random.Random()
+
+        self._memo: dict[tuple[bytes, frozenset[int], int, int], float] = {}
+
+    def use_rng(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    def sample_draws(self, closed_codes: tuple[int, ...]) -> tuple[int, ...]:
+        if len(closed_codes) <= self.n_samples:
+            return closed_codes
+
+        return tuple(self.rng.sample(closed_codes, self.n_samples))
+
+    def best_value_per_tile(
+        self, cells: bytearray, tile_codes: tuple[int, ...], lead: int, sign: int
+    ) -> dict[int, int]:
+        """Return the best lead the side to move can reach with every tile."""
+        best_values: dict[int, int] = {}
+        for encoded_action in iter_encoded_actions(cells, tile_codes):
+            tile_code = encoded_action & FIELD_MASK
+            value = lead + self.mover_delta(cells, encoded_action, sign)
+            if value > best_values.get(tile_code, -INFINITY):
+                best_values[tile_code] = value
+
+        return best_values
+
+    def decision_value(
+        self,
+        cells: bytearray,
+        tile_codes: tuple[int, ...],
+        closed_codes: tuple[int, ...],
+        lead: int,
+        sign: int,
+        depth: int,
+    ) -> float:
+        """Return the expected value of a position for the side to move."""
+        self.n_nodes_searched += 1
+
+        if depth == 0 or len(tile_codes) == 0:
+            return lead
+
+        key = (bytes(cells), frozenset(tile_codes), sign, depth)
+        if key in self._memo:
+            return self._memo[key]
+
+        if depth == 1:
+            best_values = self.best_value_per_tile(cells, tile_codes, lead, sign)
+            value = max(best_values.values(), default=lead)
+        else:
+            value = -INFINITY
+            for child_lead, encoded_action in self.ordered_children(
+                cells, tile_codes, lead, sign
+            ):
+                make_encoded_action(cells, encoded_action)
+                value = max(
+                    value,
+                    -self.chance_value(
+                        cells,
+                        remove_tile_code(tile_codes, encoded_action & FIELD_MASK),
+                        closed_codes,
+                        -child_lead,
+                        -sign,
+                        depth - 1,
+                    ),
+                )
+                unmake_encoded_action(cells, encoded_action)
+
+            if value == -INFINITY:
+                value = lead
+
+        self._memo[key] = value
+
+        return value
+
+    def chance_value(
+        self,
+        cells: bytearray,
+        tile_codes: tuple[int, ...],
+        closed_codes: tuple[int, ...],
+        lead: int,
+        sign: int,
+        depth: int,
+    ) -> float:
+        """Return the value for the side to move, averaged over the next draw."""
+        self.n_nodes_searched += 1
+
+        if len(closed_codes) == 0 or depth == 0:
+            return self.decision_value(
+                cells, tile_codes, closed_codes, lead, sign, depth
+            )
+
+        draws = self.sample_draws(closed_codes)
+
+        if depth == 1:
+            # a draw only adds one tile to the open tiles, so the best action
+            # with each tile only has to be found once for all draws
+            best_values = self.best_value_per_tile(
+                cells, tile_codes + draws, lead, sign
+            )
+            best_open_value = max(
+                (best_values.get(tile_code, -INFINITY) for tile_code in tile_codes),
+                default=-INFINITY,
+            )
+
+            values = [
+                max(best_open_value, best_values.get(draw, -INFINITY)) for draw in draws
+            ]
+
+            return fmean(value if value != -INFINITY else lead for value in values)
+
+        return fmean(
+            self.decision_value(
+                cells,
+                tile_codes + (draw,),
+                remove_tile_code(closed_codes, draw),
+                lead,
+                sign,
+                depth,
+            )
+            for draw in draws
+        )
+
+    def next_action(
+        self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
+    ) -> Action:
+        start_time = perf_counter()
+        self.n_nodes_searched = 0
+        self._memo.clear()
+
+        cells, tile_codes, sign, _, _, children = self.root_position(board, open_tiles)
+        closed_codes = tuple(tile.code for tile in closed_tiles)
+
+        best_value = -float(INFINITY)
+        best_action = children[0][1]
+        for child_lead, encoded_action in children:
+            if (
+                self.time_budget is not None
+                and perf_counter() - start_time > self.time_budget
+            ):
+                break
+
+            make_encoded_action(cells, encoded_action)
+            value = -self.chance_value(
+                cells,
+                remove_tile_code(tile_codes, encoded_action & FIELD_MASK),
+                closed_codes,
+                -child_lead,
+                -sign,
+                self.depth - 1,
+            )
+            unmake_encoded_action(cells, encoded_action)
+
+            if value > best_value:
+                best_value = value
+                best_action = encoded_action
+
+        return EncodedAction(best_action).to_action()
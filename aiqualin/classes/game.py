@@ -1,4 +1,6 @@
+import itertools
 import random
+import time
 from dataclasses import dataclass, field
 
 from rich import print
@@ -10,8 +12,28 @@ from aiqualin.classes.cli_player import CLIPlayer
 from aiqualin.classes.color import Color
 from aiqualin.classes.game_scorer import GameScorer
 from aiqualin.classes.player import AbstractPlayer
+from aiqualin.classes.profiling import profiled
 from aiqualin.classes.simple_score_based_ai import SimpleScoreBasedAI
 from aiqualin.classes.tile import Tile
+from aiqualin.classes.timer import TIMERS
+
+
+def spawn_rng(rng: random.Random, name: str) -> random.Random:
+    """Return a new random number generator that is seeded from `rng` and `name`.
+
+    Generators spawned with different names give independent streams, and the
+    same seed of `rng` always spawns the same generators, also in other
+    processes (string seeds do not depend on the hash seed).
+    """
+    return random.Random(f"{rng.getrandbits(64)}:{name}")
+
+
+_GAME_NUMBERS = itertools.count(1)
+
+
+def new_game_id() -> str:
+    """Return an id that differs between games, also between runs."""
+    return f"game_{time.strftime('%Y%m%d_%H%M%S')}_{next(_GAME_NUMBERS):03d}"
 
 
 def create_full_closed_tiles() -> list[Tile]:
@@ -39,9 +61,21 @@ class Game:
     players: tuple[AbstractPlayer, AbstractPlayer] = field(
         default_factory=lambda: (SimpleScoreBasedAI(Color), SimpleScoreBasedAI(Animal))
     )
+    # whether the board and the scores are printed while playing, turned off
+    # for simulating many games
+    verbose: bool = True
+    # all random numbers of the game, and of its players, are drawn from this
+    # generator, so a game is reproduced by seeding it
+    rng: random.Random = field(default_factory=random.Random)
+    # the prefix of the names of the profiles of the game, see `profiled`
+    game_id: str = field(default_factory=new_game_id)
     player_names: tuple[str, str] = field(init=False)
 
     def __post_init__(self) -> None:
+        for i, player in enumerate(self.players):
+            player.use_rng(spawn_rng(self.rng, f"player_{i}"))
+            player.verbose = self.verbose
+
         self.shuffle_closed_tiles()
 
         self.replenish_open_tiles()
@@ -55,13 +89,17 @@ class Game:
 
         self.player_names = player_names
 
+    def log(self, *args) -> None:
+        if self.verbose:
+            print(*args)
+
     def shuffle_closed_tiles(self) -> None:
-        random.shuffle(self.closed_tiles)
+        self.rng.shuffle(self.closed_tiles)
 
     def replenish_open_tiles(self) -> None:
         while len(self.open_tiles) < N_OPEN_TILES and len(self.closed_tiles) > 0:
             n_need_to_replenish = N_OPEN_TILES - len(self.open_tiles)
-            print(f"Need to replenish {n_need_to_replenish} more tiles.")
+            self.log(f"Need to replenish {n_need_to_replenish} more tiles.")
             try:
                 new_tile = self.get_new_tile()
             except Exception:
@@ -87,41 +125,66 @@ class Game:
 
         self.replenish_open_tiles()
 
-    def play(self) -> None:
+    def play(self) -> tuple[int, int]:
+        """Play the game until all tiles are placed.
+
+        Returns:
+            The final scores of the animals and the colors.
+        """
+        with profiled(self.game_id, scope="game"):
+            return self.play_turns()
+
+    def play_turns(self) -> tuple[int, int]:
+        n_turns = 0
         while len(self.open_tiles) > 0:
             for i, player in enumerate(self.players):
                 player_name = self.player_names[i]
-                print(f"{player_name}'s turn:")
-
-                action = player.next_action(
-                    self.board, self.open_tiles, self.closed_tiles
-                )
+                self.log(f"{player_name}'s turn:")
+
+                n_turns += 1
+                with profiled(
+                    f"{self.game_id}_turn_{n_turns:02d}_{player_name}", scope="turn"
+                ), TIMERS.span(f"{player.__class__.__name__}.next_action"):
+                    action = player.next_action(
+                        self.board, self.open_tiles, self.closed_tiles
+                    )
                 # print("Action:", action)
-                self.play_action(action)
-                print()
-                self.board.visualize()
-                print()
-                print(
-                    f"Animal score: {GameScorer(self.board).score_for_property(Animal)}"
-                )
-                print(
-                    f"Color score: {GameScorer(self.board).score_for_property(Color)}"
-                )
-                print()
+                with TIMERS.span("Game.play_action"):
+                    self.play_action(action)
+
+                if self.verbose:
+                    print()
+                    self.board.visualize()
+                    print()
+                    print(
+                        "Animal score:"
+                        f" {GameScorer(self.board).score_for_property(Animal)}"
+                    )
+                    print(
+                        "Color score:"
+                        f" {GameScorer(self.board).score_for_property(Color)}"
+                    )
+                    print()
 
         score_animals = GameScorer(self.board).score_for_property(Animal)
         score_colors = GameScorer(self.board).score_for_property(Color)
 
-        print("Final score:")
-        print(f"  Animals: {score_animals}")
-        print(f"  Colors: {score_colors}")
+        self.log("Final score:")
+        self.log(f"  Animals: {score_animals}")
+        self.log(f"  Colors: {score_colors}")
 
         if score_animals > score_colors:
-            print("Animals win!")
+            self.log("Animals win!")
         elif score_animals < score_colors:
-            print("Colors win!")
+            self.log("Colors win!")
         else:
-            print("Tie!")
+            self.log("Tie!")
+
+        if TIMERS.enabled:
+            self.log()
+            self.log(TIMERS.format_table())
+
+        return score_animals, score_colors
 
 
 if __name__ == "__main__":
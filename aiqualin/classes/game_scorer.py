@@ -1,16 +1,305 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
-import networkx as nx
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+from aiqualin.classes.action import Action
 from aiqualin.classes.animal import Animal
-from aiqualin.classes.board import Board
+from aiqualin.classes.board import N_CELLS, N_GRID, Board
 from aiqualin.classes.color import Color
-from aiqualin.classes.tile import EMPTY_TILE, Tile
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.encoded_action import (
+    FIELD_MASK,
+    MOVE_END_SHIFT,
+    MOVE_START_SHIFT,
+    NO_CELL,
+    PLACEMENT_SHIFT,
+    EncodedAction,
+)
+from aiqualin.classes.tile import EMPTY_TILE, EMPTY_TILE_CODE, Tile
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+N_COLOR_CODES = len(Color)
+
+# a component of n tiles scores 1 + 2 + ... + (n - 1) points, a component can
+# have up to 6 tiles in a real game but any size up to the whole board is scored
+LENGTH_TO_SCORE_MAP = {length: length * (length - 1) // 2 for length in range(1, 37)}
+
+# every pair of horizontally or vertically adjacent cells, each pair only once
+ADJACENT_CELL_PAIRS = tuple(
+    (cell, neighbor)
+    for cell in range(N_CELLS)
+    for neighbor in (
+        cell + 1 if cell % N_GRID < N_GRID - 1 else None,
+        cell + N_GRID if cell + N_GRID < N_CELLS else None,
+    )
+    if neighbor is not None
+)
+
+NEIGHBORS = tuple(
+    tuple(
+        other
+        for pair in ADJACENT_CELL_PAIRS
+        if cell in pair
+        for other in pair
+        if other != cell
+    )
+    for cell in range(N_CELLS)
+)
+CELL_AND_NEIGHBORS = tuple(
+    frozenset((cell, *NEIGHBORS[cell])) for cell in range(N_CELLS)
+)
+
+# the empty code maps to index 6 for both properties, which never equals the
+# index of a non-empty tile, so empty cells never join a component
+ANIMAL_INDEX_OF_CODE = tuple(
+    code // N_COLOR_CODES for code in range(EMPTY_TILE_CODE + 1)
+)
+COLOR_INDEX_OF_CODE = tuple(code % N_COLOR_CODES for code in range(EMPTY_TILE_CODE + 1))
+
+# SCORE_OF_SIZE[size] is the score of a component with `size` tiles
+SCORE_OF_SIZE = (0,) + tuple(LENGTH_TO_SCORE_MAP.values())
+ROW_STARTS = tuple(range(0, N_CELLS, N_GRID))
+
+
+def _find_root(parents: list[int], cell: int) -> int:
+    while parents[cell] != cell:
+        # path halving
+        parents[cell] = parents[parents[cell]]
+        cell = parents[cell]
+
+    return cell
+
+
+def _runs_of_row(
+    property_indices: list[int | None],
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    # split a row into runs of horizontally adjacent tiles with the same
+    # property, returns the run of every cell (-1 for empty cells) and the
+    # size of every run
+    run_of_cell = []
+    run_sizes = []
+    previous_index = None
+    for property_index in property_indices:
+        if property_index is None:
+            run_of_cell.append(-1)
+        elif property_index == previous_index:
+            run_sizes[-1] += 1
+            run_of_cell.append(len(run_sizes) - 1)
+        else:
+            run_sizes.append(1)
+            run_of_cell.append(len(run_sizes) - 1)
+
+        previous_index = property_index
+
+    return tuple(run_of_cell), tuple(run_sizes)
+
+
+@lru_cache(maxsize=1 << 16)
+def _row_runs(row: bytes) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return the animal and the color runs of a row, see `_runs_of_row`.
+
+    Rows repeat a lot between the boards of a search, so the runs of every
+    row are only computed once.
+    """
+    return (
+        _runs_of_row(
+            [
+                None if code == EMPTY_TILE_CODE else ANIMAL_INDEX_OF_CODE[code]
+                for code in row
+            ]
+        ),
+        _runs_of_row(
+            [
+                None if code == EMPTY_TILE_CODE else COLOR_INDEX_OF_CODE[code]
+                for code in row
+            ]
+        ),
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def _row_pair_joins(rows: bytes) -> tuple[tuple[tuple[int, int], ...], ...]:
+    """Return which runs of two adjacent rows are joined vertically.
+
+    Args:
+        rows: The cells of the upper row followed by the cells of the lower row.
+
+    Returns:
+        The (upper run, lower run) pairs that are joined by animal and the ones
+        that are joined by color.
+    """
+    upper_row, lower_row = rows[:N_GRID], rows[N_GRID:]
+    joins = []
+    for property_runs, index_of_code in (
+        (0, ANIMAL_INDEX_OF_CODE),
+        (1, COLOR_INDEX_OF_CODE),
+    ):
+        upper_runs = _row_runs(upper_row)[property_runs][0]
+        lower_runs = _row_runs(lower_row)[property_runs][0]
+        joins.append(
+            tuple(
+                sorted(
+                    {
+                        (upper_runs[col], lower_runs[col])
+                        for col in range(N_GRID)
+                        if upper_row[col] != EMPTY_TILE_CODE
+                        and index_of_code[upper_row[col]]
+                        == index_of_code[lower_row[col]]
+                    }
+                )
+            )
+        )
+
+    return tuple(joins)
+
+
+def score_cells(cells: bytes | bytearray) -> tuple[int, int]:
+    """Compute the animal and the color score of a board in a single pass.
+
+    The board is swept row by row. The runs of every row and the vertical joins
+    between every pair of adjacent rows are looked up in caches, and the runs
+    are merged into components with a union-find over at most 36 runs.
+
+    Args:
+        cells: The tile codes of the board in row-major order, as stored in
+            `CompactBoard.cells`.
+
+    Returns:
+        The animal score and the color score.
+    """
+    cells = bytes(cells)
+    row_runs = [_row_runs(cells[start : start + N_GRID]) for start in ROW_STARTS]
+    row_pair_joins = [
+        _row_pair_joins(cells[start : start + 2 * N_GRID]) for start in ROW_STARTS[:-1]
+    ]
+
+    scores = []
+    for property_runs in (0, 1):
+        # the runs of all rows are numbered consecutively
+        run_sizes: list[int] = []
+        first_runs = []
+        for runs in row_runs:
+            first_runs.append(len(run_sizes))
+            run_sizes.extend(runs[property_runs][1])
+
+        parents = list(range(len(run_sizes)))
+        for row_index, joins in enumerate(row_pair_joins):
+            upper_offset = first_runs[row_index]
+            lower_offset = first_runs[row_index + 1]
+            for upper_run, lower_run in joins[property_runs]:
+                root = _find_root(parents, upper_offset + upper_run)
+                lower_root = _find_root(parents, lower_offset + lower_run)
+                if root != lower_root:
+                    parents[root] = lower_root
+                    run_sizes[lower_root] += run_sizes[root]
+
+        scores.append(
+            sum(
+                SCORE_OF_SIZE[run_sizes[run]]
+                for run in range(len(run_sizes))
+                if parents[run] == run
+            )
+        )
+
+    return scores[0], scores[1]
+
+
+def _score_components_around(
+    cells: bytes | bytearray, seeds: set[int], index_of_code: tuple[int, ...]
+) -> int:
+    # flood fill the components that contain any of the seed cells
+    visited: set[int] = set()
+    score = 0
+    for seed in seeds:
+        if seed in visited or cells[seed] == EMPTY_TILE_CODE:
+            continue
+
+        property_index = index_of_code[cells[seed]]
+        visited.add(seed)
+        stack = [seed]
+        size = 0
+        while stack:
+            cell = stack.pop()
+            size += 1
+            for neighbor in NEIGHBORS[cell]:
+                if (
+                    neighbor not in visited
+                    and index_of_code[cells[neighbor]] == property_index
+                ):
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+
+        score += LENGTH_TO_SCORE_MAP[size]
+
+    return score
+
+
+def score_delta_cells(
+    cells: bytes | bytearray,
+    new_cells: bytes | bytearray,
+    changed_cells: tuple[int, ...],
+) -> tuple[int, int]:
+    """Compute how the animal and the color score change between two boards.
+
+    Only the components that touch one of the changed cells or one of their
+    neighbors can differ between the two boards, so only those are visited.
+
+    Args:
+        cells: The tile codes of the board before the change.
+        new_cells: The tile codes of the board after the change.
+        changed_cells: The indices of the cells that differ between the boards.
+
+    Returns:
+        The change of the animal score and the change of the color score.
+    """
+    seeds = set().union(*(CELL_AND_NEIGHBORS[cell] for cell in changed_cells))
+
+    delta_animal = _score_components_around(
+        new_cells, seeds, ANIMAL_INDEX_OF_CODE
+    ) - _score_components_around(cells, seeds, ANIMAL_INDEX_OF_CODE)
+    delta_color = _score_components_around(
+        new_cells, seeds, COLOR_INDEX_OF_CODE
+    ) - _score_components_around(cells, seeds, COLOR_INDEX_OF_CODE)
+
+    return delta_animal, delta_color
+
+
+def encoded_action_delta(
+    cells: bytes | bytearray, encoded_action: int
+) -> tuple[int, int]:
+    """Compute how the scores change when applying an encoded action to a board.
+
+    Args:
+        cells: The tile codes of the board before the action.
+        encoded_action: The action in the integer form of `EncodedAction`.
+
+    Returns:
+        The change of the animal score and the change of the color score.
+    """
+    new_cells = bytearray(cells)
+
+    placement_cell = encoded_action >> PLACEMENT_SHIFT & FIELD_MASK
+    changed_cells: tuple[int, ...] = (placement_cell,)
+
+    move_start_cell = encoded_action >> MOVE_START_SHIFT & FIELD_MASK
+    if move_start_cell != NO_CELL:
+        move_end_cell = encoded_action >> MOVE_END_SHIFT & FIELD_MASK
+        new_cells[move_end_cell] = new_cells[move_start_cell]
+        new_cells[move_start_cell] = EMPTY_TILE_CODE
+        changed_cells += (move_start_cell, move_end_cell)
+
+    new_cells[placement_cell] = encoded_action & FIELD_MASK
+
+    return score_delta_cells(cells, new_cells, changed_cells)
 
 
 @dataclass
 class GameScorer:
-    board: Board
+    board: Board | CompactBoard
 
     def get_property_from_tile(
         self, tile: Tile, property_to_score: type[Animal | Color]
@@ -23,11 +312,15 @@ class GameScorer:
         raise ValueError("property_to_score must be Animal or Color")
 
     def create_tile_graph(self, property_to_score: type[Animal | Color]) -> nx.Graph:
+        # networkx is an optional dependency, it is only needed to inspect the
+        # components of a board as a graph
+        import networkx as nx
+
         graph = nx.Graph()
 
         for row_index, row in enumerate(self.board.tiles):
             for col_index, tile in enumerate(row):
-                if tile == EMPTY_TILE:
+                if tile is EMPTY_TILE:
                     continue
 
                 property_value = self.get_property_from_tile(
@@ -56,28 +349,49 @@ class GameScorer:
 
         return graph
 
-    def score_for_property(self, property_to_score: type[Animal | Color]) -> int:
+    def graph_score_for_property(self, property_to_score: type[Animal | Color]) -> int:
+        import networkx as nx
+
         graph = self.create_tile_graph(property_to_score=property_to_score)
 
         ccs = nx.connected_components(graph)
 
-        length_to_score_map = {
-            1: 0,
-            2: 1,
-            3: 3,
-            4: 6,
-            5: 10,
-            6: 15,
-        }
-
-        score = sum(length_to_score_map[len(cc)] for cc in ccs if len(cc) > 1)
+        score = sum(LENGTH_TO_SCORE_MAP[len(cc)] for cc in ccs if len(cc) > 1)
 
         return score
 
+    def score_properties(self) -> tuple[int, int]:
+        """Return the animal and the color score of the board."""
+        return score_cells(self.board.cells)
+
+    def score_for_property(self, property_to_score: type[Animal | Color]) -> int:
+        score_animal, score_color = self.score_properties()
+
+        if property_to_score == Animal:
+            return score_animal
+        elif property_to_score == Color:
+            return score_color
+
+        raise ValueError("property_to_score must be Animal or Color")
+
+    def delta(self, action: Action) -> tuple[int, int]:
+        """Return how the animal and the color score change when applying an action.
+
+        Args:
+            action: The action to apply to the board.
+
+        Returns:
+            The change of the animal score and the change of the color score.
+        """
+        return self.encoded_delta(EncodedAction.from_action(action))
+
+    def encoded_delta(self, encoded_action: int) -> tuple[int, int]:
+        """Same as `delta` for an action in the integer form of `EncodedAction`."""
+        return encoded_action_delta(self.board.cells, encoded_action)
+
     @property
     def score(self) -> int:
-        score_animal = self.score_for_property(Animal)
-        score_color = self.score_for_property(Color)
+        score_animal, score_color = self.score_properties()
 
         # the difference between the two scores is the final score
         return score_animal - score_color
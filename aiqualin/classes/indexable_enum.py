@@ -1,9 +1,18 @@
 from enum import Enum
+from functools import cache
 from typing import SupportsIndex
 
 from typing_extensions import Self
 
 
+@cache
+def _index_tables(enum_class: type[Enum]) -> tuple[tuple, dict]:
+    # the members in definition order and the index of every member, built
+    # once per enumeration
+    members = tuple(enum_class)
+    return members, {member: index for index, member in enumerate(members)}
+
+
 class IndexableEnum(Enum):
     """A base class for creating indexable enumerations."""
 
@@ -17,7 +26,7 @@ class IndexableEnum(Enum):
         Returns:
             The enumeration value corresponding to the given index.
         """
-        return list(cls)[index]
+        return _index_tables(cls)[0][index]
 
     @classmethod
     def to_index(cls, value: Self) -> int:
@@ -29,4 +38,7 @@ class IndexableEnum(Enum):
         Returns:
             int: The index of the given enumeration value.
         """
-        return list(cls).index(value)
+        try:
+            return _index_tables(cls)[1][value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not in {cls.__name__}") from None
@@ -0,0 +1,97 @@
+from math import inf
+from time import perf_counter
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.alpha_beta_ai import AlphaBetaAI
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.encoded_action import EncodedAction
+from aiqualin.classes.tile import Tile
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the deadline has passed."""
+
+
+class IterativeDeepeningAI(AlphaBetaAI):
+    """
+    Searches with `AlphaBetaAI` to depths 1, 2, ... until the time budget runs
+    out, and returns the best action of the deepest search that completed.
+
+    The deadline is checked at every node of the search, which costs a clock
+    read next to the move generation and scoring of the node, and a search
+    that runs past it is abandoned. The transposition table keeps the
+    results of the shallower searches, so every deeper search starts with the
+    best actions found so far.
+    """
+
+    def __init__(
+        self,
+        side: type[Animal | Color],
+        time_budget: float = 1.0,
+        max_depth: int | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            side: The side the player plays for.
+            time_budget: The number of seconds after which the search is
+                abandoned. The search to depth 1 is always completed.
+            max_depth: The deepest search, searches go on until no open tiles
+                are left if None.
+            kwargs: The arguments of `AlphaBetaAI`, except `depth`.
+        """
+        super().__init__(side, depth=max_depth, time_budget=time_budget, **kwargs)
+
+        self.depth_reached = 0
+        self._deadline = inf
+
+    def negamax(self, *args, **kwargs) -> int:
+        if perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        return super().negamax(*args, **kwargs)
+
+    def next_action(
+        self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
+    ) -> Action:
+        start_time = perf_counter()
+        self.n_nodes_searched = 0
+        self.depth_reached = 0
+
+        cells, tile_codes, sign, _, key, children = self.root_position(
+            board, open_tiles
+        )
+        best_action = children[0][1]
+
+        # the first search has no deadline, so that there is always a result
+        self._deadline = inf
+        for depth in range(1, self.search_depth(tile_codes) + 1):
+            if perf_counter() > self._deadline:
+                break
+
+            try:
+                _, best_action = self.search_root(
+                    cells, tile_codes, children, sign, key, depth
+                )
+            except SearchTimeout:
+                # the search stopped in the middle of a line, so the cells
+                # are not restored, but they are not used anymore
+                break
+
+            self.depth_reached = depth
+            self._deadline = start_time + self.time_budget
+
+            # search the best action of this depth first at the next one
+            children = sorted(children, key=lambda child: child[1] != best_action)
+
+        self._deadline = inf
+
+        if self.verbose:
+            print(
+                f"Reached depth {self.depth_reached},"
+                f" searched {self.n_nodes_searched} nodes"
+            )
+
+        return EncodedAction(best_action).to_action()
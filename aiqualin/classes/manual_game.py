@@ -23,7 +23,7 @@ class ManualGame(Game):
         )
     )
 
-    def play(self) -> None:
+    def play(self) -> tuple[int, int]:
         while True:
             print("Who is starting? Color or Animal?")
             to_start = input('Enter "color" or "animal": ').strip().title()
@@ -67,7 +67,7 @@ class ManualGame(Game):
         color, animal = self.interpret_color_animal(*color_and_animal)
 
         tile = Tile(animal=animal, color=color)
-        assert tile != EMPTY_TILE
+        assert tile is not EMPTY_TILE
 
         return tile
 
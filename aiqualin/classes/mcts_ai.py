@@ -0,0 +1,240 @@
+import math
+import random
+from time import perf_counter
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import (
+    cells_occupancy,
+    occupancy_after_action,
+    sample_encoded_action,
+)
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard, make_encoded_action
+from aiqualin.classes.encoded_action import FIELD_MASK, EncodedAction
+from aiqualin.classes.game_scorer import score_cells
+from aiqualin.classes.player import AbstractPlayer
+from aiqualin.classes.tile import Tile
+
+# the number of times we try to draw an action that is not a child yet
+N_EXPANSION_TRIES = 10
+
+
+class MCTSNode:
+    """
+    A node of the search tree, reached by playing an action from its parent.
+
+    The reward is counted from the point of view of the side that played the
+    action.
+    """
+
+    __slots__ = ("children", "n_visits", "total_reward")
+
+    def __init__(self) -> None:
+        self.children: dict[int, MCTSNode] = {}
+        self.n_visits = 0
+        self.total_reward = 0.0
+
+
+class MCTSAI(AbstractPlayer):
+    """
+    A player that uses Monte Carlo Tree Search with UCT.
+
+    Every iteration draws an order for the closed tiles, walks down the tree
+    with UCT, adds one new child and plays random actions until the game ends.
+    The side that ends up with the higher score wins the playout.
+
+    Nodes only get new children while the number of children is below
+    ``widening_constant * n_visits ** widening_exponent`` (progressive
+    widening), and new children are drawn with `sample_encoded_action`, so the
+    full set of actions is never generated. Since the tiles that are open
+    below the root depend on the draws, children whose tile is not open in the
+    current iteration are skipped.
+    """
+
+    def __init__(
+        self,
+        side: type[Animal | Color],
+        n_iterations: int | None = 1000,
+        time_budget: float | None = None,
+        exploration: float = math.sqrt(2),
+        widening_constant: float = 2.0,
+        widening_exponent: float = 0.5,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Args:
+            side: The side the player plays for.
+            n_iterations: The number of iterations per action, no limit if None.
+            time_budget: The number of seconds per action, no limit if None.
+            exploration: The exploration constant of UCT.
+            widening_constant: How many children a node can have after its first
+                visit.
+            widening_exponent: How fast the number of children a node can have
+                grows with its number of visits.
+            rng: The random number generator used for the draws and playouts.
+        """
+        super().__init__(side)
+
+        assert (
+            n_iterations is not None or time_budget is not None
+        ), "either n_iterations or time_budget must be set"
+
+        self.n_iterations = n_iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.widening_constant = widening_constant
+        self.widening_exponent = widening_exponent
+        self.rng = rng if rng is not None else random.Random()
+
+        self.n_playouts = 0
+
+    def use_rng(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    def max_children(self, node: MCTSNode) -> int:
+        return max(
+            1, int(self.widening_constant * node.n_visits**self.widening_exponent)
+        )
+
+    def select_child(
+        self, node: MCTSNode, tile_codes: list[int]
+    ) -> tuple[int, MCTSNode] | None:
+        log_n_visits = math.log(node.n_visits) if node.n_visits > 0 else 0.0
+
+        best_child = None
+        best_value = -math.inf
+        for encoded_action, child in node.children.items():
+            if encoded_action & FIELD_MASK not in tile_codes:
+                continue
+
+            if child.n_visits == 0:
+                return encoded_action, child
+
+            value = child.total_reward / child.n_visits + self.exploration * math.sqrt(
+                log_n_visits / child.n_visits
+            )
+            if value > best_value:
+                best_value = value
+                best_child = (encoded_action, child)
+
+        return best_child
+
+    def expand(
+        self, node: MCTSNode, occupancy: int, tile_codes: list[int]
+    ) -> tuple[int, MCTSNode] | None:
+        for _ in range(N_EXPANSION_TRIES):
+            encoded_action = sample_encoded_action(occupancy, tile_codes, self.rng)
+            if encoded_action not in node.children:
+                child = node.children[encoded_action] = MCTSNode()
+                return encoded_action, child
+
+        return None
+
+    def run_iteration(
+        self,
+        root: MCTSNode,
+        root_cells: bytes,
+        root_tile_codes: list[int],
+        closed_codes: list[int],
+        sign: int,
+    ) -> None:
+        cells = bytearray(root_cells)
+        occupancy = cells_occupancy(cells)
+        tile_codes = list(root_tile_codes)
+        draws = list(closed_codes)
+        self.rng.shuffle(draws)
+
+        def play(encoded_action: int) -> None:
+            nonlocal occupancy
+            make_encoded_action(cells, encoded_action)
+            occupancy = occupancy_after_action(occupancy, encoded_action)
+            tile_codes.remove(encoded_action & FIELD_MASK)
+            if draws:
+                tile_codes.append(draws.pop())
+
+        # selection and expansion
+        path = [root]
+        node = root
+        while tile_codes:
+            selected = None
+            if len(node.children) < self.max_children(node):
+                selected = self.expand(node, occupancy, tile_codes)
+            if selected is None:
+                selected = self.select_child(node, tile_codes)
+            if selected is None:
+                # none of the children can be played with the open tiles
+                selected = self.expand(node, occupancy, tile_codes)
+            if selected is None:
+                break
+
+            encoded_action, node = selected
+            play(encoded_action)
+            path.append(node)
+
+            if node.n_visits == 0:
+                break
+
+        # random playout
+        while tile_codes:
+            play(sample_encoded_action(occupancy, tile_codes, self.rng))
+
+        score_animal, score_color = score_cells(cells)
+        if score_animal == score_color:
+            reward = 0.5
+        else:
+            reward = 1.0 if (score_animal > score_color) == (sign == 1) else 0.0
+
+        # the root is reached by an action of the opponent
+        root.n_visits += 1
+        root.total_reward += 1.0 - reward
+        for ply, visited_node in enumerate(path[1:]):
+            visited_node.n_visits += 1
+            visited_node.total_reward += reward if ply % 2 == 0 else 1.0 - reward
+
+        self.n_playouts += 1
+
+    def search(
+        self,
+        cells: bytes,
+        tile_codes: list[int],
+        closed_codes: list[int],
+        sign: int,
+        start_time: float,
+    ) -> MCTSNode:
+        """Run the iterations of one action and return the root of the tree."""
+        root = MCTSNode()
+        n_iterations = 0
+        while (self.n_iterations is None or n_iterations < self.n_iterations) and (
+            self.time_budget is None or perf_counter() - start_time < self.time_budget
+        ):
+            self.run_iteration(root, cells, tile_codes, closed_codes, sign)
+            n_iterations += 1
+
+        return root
+
+    def next_action(
+        self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
+    ) -> Action:
+        start_time = perf_counter()
+        self.n_playouts = 0
+
+        cells = CompactBoard.from_board(board).cells
+        tile_codes = [tile.code for tile in open_tiles]
+        closed_codes = [tile.code for tile in closed_tiles]
+        sign = 1 if self.our_side == Animal else -1
+
+        root = self.search(cells, tile_codes, closed_codes, sign, start_time)
+
+        if len(root.children) == 0:
+            # not even one iteration fit in the time budget
+            encoded_action = sample_encoded_action(
+                cells_occupancy(cells), tile_codes, self.rng
+            )
+        else:
+            encoded_action = max(
+                root.children, key=lambda action: root.children[action].n_visits
+            )
+
+        return EncodedAction(encoded_action).to_action()
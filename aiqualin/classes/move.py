@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Move:
+    """
+    Represents the movement part of an action, a tile sliding from one cell to
+    another. The coordinates are all -1 if no tile is moved.
+    """
+
+    move_start_row: int
+    move_start_col: int
+    move_end_row: int
+    move_end_col: int
+
+    def is_no_movement(self) -> bool:
+        return self == NO_MOVEMENT
+
+
+NO_MOVEMENT = Move(
+    move_start_row=-1, move_start_col=-1, move_end_row=-1, move_end_col=-1
+)
+
+__all__ = ["Move", "NO_MOVEMENT"]
@@ -0,0 +1,251 @@
+import math
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from time import perf_counter
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import cells_occupancy, sample_encoded_action
+from aiqualin.classes.alpha_beta_ai import INFINITY, AlphaBetaAI
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.encoded_action import EncodedAction
+from aiqualin.classes.mcts_ai import MCTSAI
+from aiqualin.classes.tile import Tile
+
+# Positions are sent to the workers as the bytes of the cells and tuples of
+# tile codes, which are cheap to pickle. The worker functions have to be
+# defined at the top level of the module so that they can be pickled.
+
+
+def _mcts_root_statistics(
+    side: type[Animal | Color],
+    cells: bytes,
+    tile_codes: tuple[int, ...],
+    closed_codes: tuple[int, ...],
+    n_iterations: int | None,
+    time_budget: float | None,
+    exploration: float,
+    widening_constant: float,
+    widening_exponent: float,
+    seed: int,
+) -> dict[int, tuple[int, float]]:
+    player = MCTSAI(
+        side,
+        n_iterations=n_iterations,
+        time_budget=time_budget,
+        exploration=exploration,
+        widening_constant=widening_constant,
+        widening_exponent=widening_exponent,
+        rng=random.Random(seed),
+    )
+    sign = 1 if side == Animal else -1
+    root = player.search(
+        cells, list(tile_codes), list(closed_codes), sign, perf_counter()
+    )
+
+    return {
+        encoded_action: (child.n_visits, child.total_reward)
+        for encoded_action, child in root.children.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _worker_alpha_beta_ai(
+    side: type[Animal | Color],
+    depth: int,
+    max_branching: int | None,
+    use_symmetry: bool,
+) -> AlphaBetaAI:
+    # every worker keeps its player, and with it its transposition table,
+    # across turns
+    return AlphaBetaAI(
+        side, depth=depth, max_branching=max_branching, use_symmetry=use_symmetry
+    )
+
+
+def _alpha_beta_best_child(
+    side: type[Animal | Color],
+    depth: int,
+    max_branching: int | None,
+    use_symmetry: bool,
+    cells: bytes,
+    tile_codes: tuple[int, ...],
+    children: list[tuple[int, int]],
+) -> tuple[int, int, int]:
+    player = _worker_alpha_beta_ai(side, depth, max_branching, use_symmetry)
+    player.n_nodes_searched = 0
+
+    sign = 1 if side == Animal else -1
+    cells = bytearray(cells)
+    key = player.position_key(cells, tile_codes, sign)
+
+    best_value, best_action = player.search_root(
+        cells, tile_codes, children, sign, key, depth
+    )
+
+    return best_value, best_action, player.n_nodes_searched
+
+
+class _ProcessPoolMixin:
+    """
+    Owns a process pool that is created on first use and reused across turns,
+    since starting the worker processes takes much longer than a search.
+    """
+
+    n_workers: int
+    _executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ParallelMCTSAI(_ProcessPoolMixin, MCTSAI):
+    """
+    Runs independent Monte Carlo Tree Searches in worker processes (root
+    parallelisation) and sums the visits of the actions at the root.
+
+    The iterations are split between the workers, while every worker searches
+    for the whole time budget.
+    """
+
+    def __init__(
+        self, side: type[Animal | Color], n_workers: int | None = None, **kwargs
+    ) -> None:
+        """
+        Args:
+            side: The side the player plays for.
+            n_workers: The number of worker processes, the number of CPUs if
+                None.
+            kwargs: The arguments of `MCTSAI`.
+        """
+        super().__init__(side, **kwargs)
+
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count() or 1
+
+    def next_action(
+        self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
+    ) -> Action:
+        cells = CompactBoard.from_board(board).cells
+        tile_codes = tuple(tile.code for tile in open_tiles)
+        closed_codes = tuple(tile.code for tile in closed_tiles)
+
+        n_iterations_per_worker = (
+            math.ceil(self.n_iterations / self.n_workers)
+            if self.n_iterations is not None
+            else None
+        )
+
+        futures = [
+            self.executor.submit(
+                _mcts_root_statistics,
+                self.our_side,
+                cells,
+                tile_codes,
+                closed_codes,
+                n_iterations_per_worker,
+                self.time_budget,
+                self.exploration,
+                self.widening_constant,
+                self.widening_exponent,
+                self.rng.getrandbits(64),
+            )
+            for _ in range(self.n_workers)
+        ]
+
+        n_visits: dict[int, int] = {}
+        for future in futures:
+            for encoded_action, (n_child_visits, _) in future.result().items():
+                n_visits[encoded_action] = (
+                    n_visits.get(encoded_action, 0) + n_child_visits
+                )
+
+        self.n_playouts = sum(n_visits.values())
+
+        if len(n_visits) == 0:
+            # not even one iteration fit in the time budget of any worker
+            encoded_action = sample_encoded_action(
+                cells_occupancy(cells), tile_codes, self.rng
+            )
+        else:
+            encoded_action = max(n_visits, key=n_visits.__getitem__)
+
+        return EncodedAction(encoded_action).to_action()
+
+
+class ParallelAlphaBetaAI(_ProcessPoolMixin, AlphaBetaAI):
+    """
+    Splits the ordered actions at the root between worker processes that
+    search them with `AlphaBetaAI.negamax`, and keeps the best result.
+
+    Every worker only prunes with the best value it has found itself and keeps
+    its own transposition table, so the workers search more nodes in total than
+    a single process would.
+    """
+
+    def __init__(
+        self, side: type[Animal | Color], n_workers: int | None = None, **kwargs
+    ) -> None:
+        """
+        Args:
+            side: The side the player plays for.
+            n_workers: The number of worker processes, the number of CPUs if
+                None.
+            kwargs: The arguments of `AlphaBetaAI`, except `time_budget`.
+        """
+        super().__init__(side, **kwargs)
+
+        assert self.time_budget is None, "time_budget is not supported"
+
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count() or 1
+
+    def next_action(
+        self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
+    ) -> Action:
+        cells, tile_codes, _, _, _, children = self.root_position(board, open_tiles)
+
+        # deal the children out in turns, so that every worker gets some of
+        # the most promising ones
+        futures = [
+            self.executor.submit(
+                _alpha_beta_best_child,
+                self.our_side,
+                self.search_depth(tile_codes),
+                self.max_branching,
+                self.use_symmetry,
+                bytes(cells),
+                tile_codes,
+                children[worker_index :: self.n_workers],
+            )
+            for worker_index in range(min(self.n_workers, len(children)))
+        ]
+
+        order = {encoded_action: i for i, (_, encoded_action) in enumerate(children)}
+        best_value = -INFINITY
+        best_action = children[0][1]
+        self.n_nodes_searched = 0
+        for future in futures:
+            value, encoded_action, n_nodes_searched = future.result()
+            self.n_nodes_searched += n_nodes_searched
+            # on ties prefer the action that is ordered first, like the
+            # single process search
+            if value > best_value or (
+                value == best_value and order[encoded_action] < order[best_action]
+            ):
+                best_value = value
+                best_action = encoded_action
+
+        return EncodedAction(best_action).to_action()
@@ -1,16 +1,29 @@
+import random
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import iter_encoded_actions
 from aiqualin.classes.animal import Animal
 from aiqualin.classes.board import Board
 from aiqualin.classes.color import Color
-from aiqualin.classes.game_scorer import GameScorer
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.score_cache import SHARED_SCORE_CACHE, ScoreCache
 from aiqualin.classes.tile import Tile
 
 
 class AbstractPlayer(ABC):
+    # the scores of boards are cached across all players, a player can be
+    # given its own cache by assigning to this attribute
+    score_cache: ScoreCache = SHARED_SCORE_CACHE
+
     def __init__(self, side: type[Animal | Color]) -> None:
         self._side = side
+        # whether the player prints what it is doing
+        self.verbose = True
+        # the actions of the last position, see `encoded_actions`
+        self._actions_key: tuple[bytes, tuple[int, ...]] | None = None
+        self._actions: list[int] = []
 
     @property
     def our_side(self) -> type[Animal | Color]:
@@ -20,11 +33,54 @@ class AbstractPlayer(ABC):
     def their_side(self) -> type[Animal | Color]:
         return Animal if self.our_side == Color else Color
 
-    def our_score(self, board: Board) -> int:
-        return GameScorer(board).score_for_property(self.our_side)
+    def side_scores(self, board: Board | CompactBoard) -> tuple[int, int]:
+        """Return our score and their score, looked up in `score_cache`."""
+        score_animal, score_color = self.score_cache.scores(board.cells)
+        if self.our_side == Animal:
+            return score_animal, score_color
+
+        return score_color, score_animal
+
+    def our_score(self, board: Board | CompactBoard) -> int:
+        return self.side_scores(board)[0]
+
+    def their_score(self, board: Board | CompactBoard) -> int:
+        return self.side_scores(board)[1]
+
+    def our_delta(self, delta: tuple[int, int]) -> int:
+        """Turn an (animal, color) score delta into the change of our lead."""
+        delta_animal, delta_color = delta
+        if self.our_side == Animal:
+            return delta_animal - delta_color
+
+        return delta_color - delta_animal
+
+    def encoded_actions(
+        self, board: Board | CompactBoard, open_tiles: list[Tile]
+    ) -> list[int]:
+        """Return every action of a position in the integer form of `EncodedAction`.
+
+        The list is shared with later calls for the same position and must not
+        be changed.
+        """
+        actions_key = (board.cells, tuple(tile.code for tile in open_tiles))
+        if actions_key != self._actions_key:
+            self._actions = list(iter_encoded_actions(*actions_key))
+            self._actions_key = actions_key
+
+        return self._actions
+
+    def iter_encoded_actions(
+        self, board: Board | CompactBoard, open_tiles: list[Tile]
+    ) -> Iterator[int]:
+        """Lazily yield every action of a position, see `encoded_actions`."""
+        return iter_encoded_actions(board.cells, [tile.code for tile in open_tiles])
+
+    def use_rng(self, rng: random.Random) -> None:
+        """Draw the random numbers of the player from `rng`.
 
-    def their_score(self, board: Board) -> int:
-        return GameScorer(board).score_for_property(self.their_side)
+        Players that do not use random numbers ignore it.
+        """
 
     @abstractmethod
     def next_action(
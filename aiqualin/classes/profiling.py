@@ -0,0 +1,163 @@
+"""
+Opt-in profiling of turns and games.
+
+Profiling is configured with `configure_profiling`, with the ``--profile``
+flags of ``python -m aiqualin`` and ``python -m aiqualin.tournament``, or
+with these environment variables:
+
+- ``AIQUALIN_PROFILE``: the directory the profiles are written to, profiling
+  is off if it is not set.
+- ``AIQUALIN_PROFILE_SCOPE``: ``turn`` to profile every `next_action` call
+  (the default), or ``game`` to profile whole games.
+- ``AIQUALIN_PROFILE_FORMAT``: ``pstats`` to write cProfile ``.pstats`` files
+  (the default), or ``collapsed`` to write sampled stacks in the collapsed
+  format of flamegraph tools.
+"""
+
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import ContextManager
+
+SCOPES = ("turn", "game")
+FORMATS = ("pstats", "collapsed")
+
+
+@dataclass
+class ProfilingSettings:
+    directory: str | None = None
+    scope: str = "turn"
+    output_format: str = "pstats"
+
+
+def _settings_from_environment() -> ProfilingSettings:
+    return ProfilingSettings(
+        directory=os.environ.get("AIQUALIN_PROFILE") or None,
+        scope=os.environ.get("AIQUALIN_PROFILE_SCOPE", "turn"),
+        output_format=os.environ.get("AIQUALIN_PROFILE_FORMAT", "pstats"),
+    )
+
+
+PROFILING = _settings_from_environment()
+
+
+def configure_profiling(
+    directory: str | None, scope: str = "turn", output_format: str = "pstats"
+) -> None:
+    """Turn profiling on, or off if `directory` is None.
+
+    The settings are also written to the environment, so that worker processes
+    that are started afterwards profile as well.
+    """
+    assert scope in SCOPES, f"scope must be one of {SCOPES}"
+    assert output_format in FORMATS, f"output_format must be one of {FORMATS}"
+
+    PROFILING.directory = directory
+    PROFILING.scope = scope
+    PROFILING.output_format = output_format
+
+    if directory is None:
+        os.environ.pop("AIQUALIN_PROFILE", None)
+    else:
+        os.makedirs(directory, exist_ok=True)
+        os.environ["AIQUALIN_PROFILE"] = directory
+    os.environ["AIQUALIN_PROFILE_SCOPE"] = scope
+    os.environ["AIQUALIN_PROFILE_FORMAT"] = output_format
+
+
+class StackSampler:
+    """
+    A sampling profiler that records the stack of the thread that created it
+    every `interval` seconds from a background thread.
+    """
+
+    def __init__(self, path: str, interval: float = 0.001) -> None:
+        self.path = path
+        self.interval = interval
+        self.stack_counts: Counter[str] = Counter()
+
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+
+            self.stack_counts[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> None:
+        self._thread.start()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self._stop.set()
+        self._thread.join()
+
+        with open(self.path, "w") as file:
+            for stack, count in self.stack_counts.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+class _CProfileSpan:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.profile = cProfile.Profile()
+
+    def __enter__(self) -> None:
+        self.profile.enable()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.profile.disable()
+        self.profile.dump_stats(self.path)
+
+
+_NO_PROFILE = nullcontext()
+
+
+def profiled(label: str, scope: str) -> ContextManager:
+    """Return a context manager that profiles its body if `scope` is profiled.
+
+    Args:
+        label: The name of the profile file, without extension.
+        scope: ``turn`` or ``game``, the body is only profiled if profiling is
+            on for this scope.
+    """
+    if PROFILING.directory is None or PROFILING.scope != scope:
+        return _NO_PROFILE
+
+    # the directory may have been set through the environment only
+    os.makedirs(PROFILING.directory, exist_ok=True)
+
+    if PROFILING.output_format == "collapsed":
+        return StackSampler(os.path.join(PROFILING.directory, f"{label}.collapsed"))
+
+    return _CProfileSpan(os.path.join(PROFILING.directory, f"{label}.pstats"))
+
+
+def add_profiling_arguments(parser) -> None:
+    """Add the ``--profile`` flags to an `argparse.ArgumentParser`."""
+    parser.add_argument(
+        "--profile",
+        metavar="DIRECTORY",
+        default=None,
+        help="write a profile of every turn (or game) to this directory",
+    )
+    parser.add_argument("--profile-scope", choices=SCOPES, default="turn")
+    parser.add_argument("--profile-format", choices=FORMATS, default="pstats")
+
+
+def configure_profiling_from_arguments(args) -> None:
+    if args.profile is not None:
+        configure_profiling(args.profile, args.profile_scope, args.profile_format)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+
+from aiqualin.classes.game_scorer import score_cells
+
+
+class ScoreCache:
+    """
+    A bounded, thread-safe map from boards to their animal and color scores.
+
+    Boards are keyed by their cells, whose hash is computed once per bytes
+    object. When the cache is full, the least recently used board is evicted.
+    """
+
+    def __init__(self, max_size: int = 1 << 16) -> None:
+        assert max_size > 0, "max_size must be positive"
+
+        self.max_size = max_size
+        self._scores: OrderedDict[bytes, tuple[int, int]] = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def scores(self, cells: bytes | bytearray) -> tuple[int, int]:
+        """Return the animal and the color score of a board, see `score_cells`."""
+        key = bytes(cells)
+
+        with self._lock:
+            scores = self._scores.get(key)
+            if scores is not None:
+                self.hits += 1
+                self._scores.move_to_end(key)
+                return scores
+
+            self.misses += 1
+
+        # score outside of the lock, so that other threads are not blocked
+        scores = score_cells(key)
+
+        with self._lock:
+            self._scores[key] = scores
+            self._scores.move_to_end(key)
+            if len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+        return scores
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# the cache that all players share unless they are given their own
+SHARED_SCORE_CACHE = ScoreCache()
@@ -1,36 +1,39 @@
 from aiqualin.classes.action import Action
-from aiqualin.classes.action_generator import ActionGenerator
 from aiqualin.classes.board import Board
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.encoded_action import EncodedAction
+from aiqualin.classes.game_scorer import GameScorer
 from aiqualin.classes.player import AbstractPlayer
 from aiqualin.classes.tile import Tile
-from aiqualin.classes.timer import Timer
+from aiqualin.classes.timer import TIMERS
 
 
 class SimpleScoreBasedAI(AbstractPlayer):
-    def score_board(self, board: Board) -> int:
-        our_score = self.our_score(board)
-        their_score = self.their_score(board)
+    def score_board(self, board: Board | CompactBoard) -> int:
+        our_score, their_score = self.side_scores(board)
 
         return our_score - their_score
 
     def next_action(
         self, board: Board, open_tiles: list[Tile], closed_tiles: list[Tile]
     ) -> Action:
-        no_print = True
-
-        with Timer("generator", no_print=no_print):
-            next_actions = list(
-                ActionGenerator(board, open_tiles, closed_tiles).generate_actions()
-            )
-
-        print(f"There are {len(next_actions)} possible actions")
-
-        with Timer("move_application", no_print=no_print):
-            next_boards = [board.apply_action(action) for action in next_actions]
-
-        with Timer("scoring", no_print=no_print):
-            next_scores = [self.score_board(next_board) for next_board in next_boards]
-
-        index_best_score = next_scores.index(max(next_scores))
-
-        return next_actions[index_best_score]
+        with TIMERS.span("SimpleScoreBasedAI.scoring"):
+            # an action only changes the components around the cells it touches,
+            # so instead of rescoring every next board we compare the changes
+            # in score. The actions are streamed, the first best one is kept.
+            board = CompactBoard.from_board(board)
+            scorer = GameScorer(board)
+            best_delta = None
+            best_action = None
+            n_actions = 0
+            for action in self.iter_encoded_actions(board, open_tiles):
+                n_actions += 1
+                delta = self.our_delta(scorer.encoded_delta(action))
+                if best_delta is None or delta > best_delta:
+                    best_delta = delta
+                    best_action = action
+
+        if self.verbose:
+            print(f"There are {n_actions} possible actions")
+
+        return EncodedAction(best_action).to_action()
@@ -0,0 +1,136 @@
+from collections.abc import Iterable
+
+from aiqualin.classes.board import N_CELLS, N_GRID, Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.tile import EMPTY_TILE_CODE
+
+N_COLOR_CODES = len(Color)
+
+_LAST = N_GRID - 1
+
+# the eight rotations and reflections of the board, as functions of the row
+# and the column of a cell
+_SYMMETRIES = (
+    lambda row, col: (row, col),
+    lambda row, col: (col, _LAST - row),
+    lambda row, col: (_LAST - row, _LAST - col),
+    lambda row, col: (_LAST - col, row),
+    lambda row, col: (row, _LAST - col),
+    lambda row, col: (_LAST - row, col),
+    lambda row, col: (col, row),
+    lambda row, col: (_LAST - col, _LAST - row),
+)
+
+# TRANSFORMS[i][cell] is the cell that ends up on `cell` under the i-th symmetry
+TRANSFORMS = tuple(
+    tuple(
+        row * N_GRID + col
+        for row, col in (symmetry(*divmod(cell, N_GRID)) for cell in range(N_CELLS))
+    )
+    for symmetry in _SYMMETRIES
+)
+
+
+def _relabel(
+    codes: Iterable[int], animal_labels: dict[int, int], color_labels: dict[int, int]
+) -> list[int]:
+    # animals and colors are renamed in the order in which they first appear
+    relabelled_codes = []
+    for code in codes:
+        if code == EMPTY_TILE_CODE:
+            relabelled_codes.append(code)
+            continue
+
+        animal_index, color_index = divmod(code, N_COLOR_CODES)
+        animal_label = animal_labels.setdefault(animal_index, len(animal_labels))
+        color_label = color_labels.setdefault(color_index, len(color_labels))
+        relabelled_codes.append(animal_label * N_COLOR_CODES + color_label)
+
+    return relabelled_codes
+
+
+def _relabel_open_tiles(
+    tile_codes: Iterable[int],
+    animal_labels: dict[int, int],
+    color_labels: dict[int, int],
+) -> list[int]:
+    # animals that are not on the board are ordered by the labels of the colors
+    # they are paired with, so that the order does not depend on their names
+    unseen_label = N_COLOR_CODES
+    tiles = [divmod(code, N_COLOR_CODES) for code in tile_codes]
+
+    unseen_animals = {
+        animal_index for animal_index, _ in tiles if animal_index not in animal_labels
+    }
+    for animal_index in sorted(
+        unseen_animals,
+        key=lambda animal_index: sorted(
+            color_labels.get(color_index, unseen_label)
+            for other_animal_index, color_index in tiles
+            if other_animal_index == animal_index
+        ),
+    ):
+        animal_labels[animal_index] = len(animal_labels)
+
+    # colors that are not on the board are named in the order in which they
+    # appear next to the animals
+    tiles.sort(
+        key=lambda tile: (
+            animal_labels[tile[0]],
+            color_labels.get(tile[1], unseen_label),
+        )
+    )
+    codes = [
+        animal_index * N_COLOR_CODES + color_index
+        for animal_index, color_index in tiles
+    ]
+
+    return sorted(_relabel(codes, animal_labels, color_labels))
+
+
+def canonical_key(cells: bytes | bytearray, tile_codes: Iterable[int] = ()) -> bytes:
+    """Return a key that is shared by all symmetric positions.
+
+    The score of a board does not change if the board is rotated or reflected,
+    or if the animals or the colors are renamed. For each of the eight
+    rotations and reflections the animals and the colors are renamed in the
+    order in which they appear on the board (and then in the open tiles), and
+    the smallest of the resulting encodings is the key. The open tiles are
+    renamed along with the board, so two positions with the same key lead to
+    the same scores for the same sequence of (transformed) actions.
+
+    The key is the same for all symmetric positions if every animal and color
+    of the open tiles is on the board. Otherwise the renaming of the ones that
+    are only in the open tiles may depend on their names in rare cases, and
+    some symmetric positions get different keys.
+
+    Args:
+        cells: The tile codes of the board in row-major order.
+        tile_codes: The codes of the open tiles.
+
+    Returns:
+        The 36 relabelled cells followed by the sorted relabelled open tiles.
+    """
+    tile_codes = sorted(tile_codes)
+
+    best_key = None
+    for transform in TRANSFORMS:
+        animal_labels: dict[int, int] = {}
+        color_labels: dict[int, int] = {}
+
+        board_codes = _relabel(
+            (cells[cell] for cell in transform), animal_labels, color_labels
+        )
+        open_codes = _relabel_open_tiles(tile_codes, animal_labels, color_labels)
+
+        key = bytes(board_codes + open_codes)
+        if best_key is None or key < best_key:
+            best_key = key
+
+    return best_key
+
+
+def canonical_board(board: Board | CompactBoard) -> CompactBoard:
+    """Return the representative of all boards that are symmetric to the board."""
+    return CompactBoard(cells=canonical_key(board.cells)[:N_CELLS])
@@ -1,18 +1,58 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from typing_extensions import Self
 
 from aiqualin.classes.animal import Animal
 from aiqualin.classes.color import Color
 
+# the shared instances of the tiles, see `Tile`
+_TILES: dict[tuple[Animal, Color], Tile] = {}
+_TILES_BY_CODE: dict[int, Tile] = {}
+
 
 @dataclass(frozen=True)
 class Tile:
+    """
+    A tile of the game. There are only 37 distinct tiles, so every tile is
+    created once and shared (a flyweight): ``Tile(animal, color)`` always
+    returns the same instance for the same animal and color, and tiles can be
+    compared with ``is``.
+    """
+
     animal: Animal
     color: Color
 
+    def __new__(cls, animal: Animal, color: Color) -> Tile:
+        tile = _TILES.get((Animal(animal), Color(color)))
+        if tile is None:
+            # registered in `__post_init__`, once the tile has been validated
+            tile = super().__new__(cls)
+
+        return tile
+
+    def __init__(self, animal: Animal, color: Color) -> None:
+        # `__init__` also runs on the shared instance that `__new__` returns,
+        # whose fields must not be overwritten
+        if "animal" in self.__dict__:
+            return
+
+        object.__setattr__(self, "animal", Animal(animal))
+        object.__setattr__(self, "color", Color(color))
+        self.__post_init__()
+
+    def __reduce__(self) -> tuple:
+        # unpickled tiles are looked up in the cache instead of being created
+        return Tile, (self.animal, self.color)
+
+    def __copy__(self) -> Tile:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Tile:
+        return self
+
     def __post_init__(self) -> None:
         animal_is_empty = self.animal == Animal.EMPTY
         color_is_empty = self.color == Color.EMPTY
@@ -21,8 +61,10 @@ class Tile:
             animal_is_empty == color_is_empty
         ), "animal and color must be both empty or both not empty"
 
+        _TILES.setdefault((self.animal, self.color), self)
+
     def short_string(self) -> str:
-        if self == EMPTY_TILE:
+        if self is EMPTY_TILE:
             return "EMPTY"
 
         animal_index = Animal.to_index(self.animal)
@@ -51,7 +93,7 @@ class Tile:
         return cls(animal=animal, color=color)
 
     def pretty_string(self) -> str:
-        if self == EMPTY_TILE:
+        if self is EMPTY_TILE:
             return "EMPTY"
 
         animal_name = self.animal.value
@@ -59,7 +101,26 @@ class Tile:
 
         return f"{animal_name.title()} {color_name.title()}"
 
+    @cached_property
+    def code(self) -> int:
+        """The tile encoded as a small integer (animal index * 7 + color index)."""
+        return Animal.to_index(self.animal) * len(Color) + Color.to_index(self.color)
+
+    @classmethod
+    def from_code(cls, code: int) -> Self:
+        tile = _TILES_BY_CODE.get(code)
+        if tile is None:
+            animal_index, color_index = divmod(code, len(Color))
+
+            animal = Animal.from_index(animal_index)
+            color = Color.from_index(color_index)
+
+            tile = _TILES_BY_CODE[code] = cls(animal=animal, color=color)
+
+        return tile
+
 
 EMPTY_TILE = Tile(animal=Animal.EMPTY, color=Color.EMPTY)
+EMPTY_TILE_CODE = EMPTY_TILE.code
 
-__all__ = ["Tile", "EMPTY_TILE"]
+__all__ = ["Tile", "EMPTY_TILE", "EMPTY_TILE_CODE"]
@@ -1,10 +1,118 @@
+import json
+import os
+from contextlib import nullcontext
+from math import ceil
 from time import perf_counter
+from typing import ContextManager
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of values sorted in ascending order."""
+    rank = max(1, ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class TimerRegistry:
+    """
+    Collects the intervals of named spans across turns and games.
+
+    The registry is disabled by default. While it is disabled, `span` returns a
+    shared context manager that does nothing, so instrumented code pays for a
+    single attribute lookup. It is enabled with `enable` or by setting the
+    environment variable ``AIQUALIN_TIMINGS=1``.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.intervals: dict[str, list[float]] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.intervals.clear()
+
+    def record(self, name: str, interval: float) -> None:
+        self.intervals.setdefault(name, []).append(interval)
+
+    def merge(self, intervals: dict[str, list[float]]) -> None:
+        """Add the intervals of another registry, e.g. from a worker process."""
+        for name, name_intervals in intervals.items():
+            self.intervals.setdefault(name, []).extend(name_intervals)
+
+    def span(self, name: str) -> ContextManager:
+        """Return a context manager that records how long its body takes."""
+        if not self.enabled:
+            return _NO_SPAN
+
+        return Timer(name, no_print=True, registry=self)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the count, total, mean, p50, p95, p99 and max of every span."""
+        summary = {}
+        for name, intervals in sorted(self.intervals.items()):
+            sorted_intervals = sorted(intervals)
+            summary[name] = {
+                "count": len(sorted_intervals),
+                "total": sum(sorted_intervals),
+                "mean": sum(sorted_intervals) / len(sorted_intervals),
+                "p50": percentile(sorted_intervals, 0.50),
+                "p95": percentile(sorted_intervals, 0.95),
+                "p99": percentile(sorted_intervals, 0.99),
+                "max": sorted_intervals[-1],
+            }
+
+        return summary
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), indent=2)
+
+    def format_table(self) -> str:
+        """Return the summary as a text table, with the times in milliseconds."""
+        header = ("span", "count", "total", "mean", "p50", "p95", "p99", "max")
+        rows = [
+            (name, str(stats["count"]))
+            + tuple(
+                f"{stats[key] * 1000:.2f}"
+                for key in ("total", "mean", "p50", "p95", "p99", "max")
+            )
+            for name, stats in self.summary().items()
+        ]
+
+        widths = [
+            max(len(row[column]) for row in (header, *rows))
+            for column in range(len(header))
+        ]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if column == 0 else cell.rjust(width)
+                for column, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in (header, *rows)
+        ]
+
+        return "\n".join(lines)
+
+
+_NO_SPAN = nullcontext()
+
+# the registry all spans are recorded in
+TIMERS = TimerRegistry(enabled=os.environ.get("AIQUALIN_TIMINGS", "") not in ("", "0"))
 
 
 class Timer:
-    def __init__(self, name: str = "", no_print: bool = False) -> None:
+    def __init__(
+        self,
+        name: str = "",
+        no_print: bool = False,
+        registry: TimerRegistry | None = None,
+    ) -> None:
         self.do_print = not no_print
         self.name = name
+        self.registry = registry if registry is not None else TIMERS
 
         self._start_time: float = -1.0
         self._end_time: float = -1.0
@@ -18,6 +126,11 @@ class Timer:
 
         self.intervals.append(self._end_time - self._start_time)
 
+        # named timers also report to the registry, so that their intervals
+        # are aggregated across instances
+        if self.name != "" and self.registry.enabled:
+            self.registry.record(self.name, self.last_interval)
+
         if self.do_print:
             name_to_print = self.name if self.name != "" else "Timer"
             print(f"{name_to_print} took {self.last_interval * 1000:.2f} ms")
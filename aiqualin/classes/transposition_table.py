@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Bound(Enum):
+    """
+    Represents how the value stored for a position relates to its true value.
+    """
+
+    EXACT = "exact"
+    LOWER = "lower"
+    UPPER = "upper"
+
+
+@dataclass(frozen=True)
+class TranspositionEntry:
+    depth: int
+    value: float
+    bound: Bound
+    best_action: int | None
+
+
+class TranspositionTable:
+    """
+    A bounded map from position keys to search results.
+
+    An entry is only replaced by a result of a search that is at least as
+    deep (depth-preferred replacement). When the table is full, the least
+    recently used entry is evicted.
+    """
+
+    def __init__(self, max_size: int = 1 << 20) -> None:
+        assert max_size > 0, "max_size must be positive"
+
+        self.max_size = max_size
+        self._entries: OrderedDict[int, TranspositionEntry] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> TranspositionEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return entry
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        value: float,
+        bound: Bound,
+        best_action: int | None = None,
+    ) -> None:
+        existing_entry = self._entries.get(key)
+        if existing_entry is not None:
+            self._entries.move_to_end(key)
+            if existing_entry.depth > depth:
+                # keep the result of the deeper search
+                return
+        elif len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+
+        self._entries[key] = TranspositionEntry(
+            depth=depth, value=value, bound=bound, best_action=best_action
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
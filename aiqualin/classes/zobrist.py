@@ -0,0 +1,67 @@
+import random
+from collections.abc import Iterable
+
+from aiqualin.classes.board import N_CELLS
+from aiqualin.classes.encoded_action import (
+    FIELD_MASK,
+    MOVE_END_SHIFT,
+    MOVE_START_SHIFT,
+    NO_CELL,
+    PLACEMENT_SHIFT,
+)
+from aiqualin.classes.tile import EMPTY_TILE_CODE
+
+# the keys are drawn from a fixed seed, so that they are the same in every
+# process and keys can be shared between workers
+_rng = random.Random(0x0A9A11)
+
+# CELL_KEYS[cell][code] is the key of the tile with the code on the cell, empty
+# cells do not contribute to the key of a board
+CELL_KEYS = tuple(
+    tuple(_rng.getrandbits(64) for _ in range(EMPTY_TILE_CODE)) + (0,)
+    for _ in range(N_CELLS)
+)
+# OPEN_TILE_KEYS[code] is the key of an open tile with the code
+OPEN_TILE_KEYS = tuple(_rng.getrandbits(64) for _ in range(EMPTY_TILE_CODE))
+# the key of a position where the player playing for colors is to move
+COLOR_TO_MOVE_KEY = _rng.getrandbits(64)
+
+
+def zobrist_key(cells: bytes | bytearray) -> int:
+    """Return the 64 bit Zobrist key of the cells of a board."""
+    key = 0
+    for cell, code in enumerate(cells):
+        key ^= CELL_KEYS[cell][code]
+
+    return key
+
+
+def tile_codes_key(tile_codes: Iterable[int]) -> int:
+    """Return the Zobrist key of a set of open tiles."""
+    key = 0
+    for tile_code in tile_codes:
+        key ^= OPEN_TILE_KEYS[tile_code]
+
+    return key
+
+
+def encoded_action_key_delta(cells: bytes | bytearray, encoded_action: int) -> int:
+    """Return the value to xor the key of a board with to apply an action to it.
+
+    Args:
+        cells: The tile codes of the board before the action.
+        encoded_action: The action in the integer form of `EncodedAction`.
+    """
+    key_delta = CELL_KEYS[encoded_action >> PLACEMENT_SHIFT & FIELD_MASK][
+        encoded_action & FIELD_MASK
+    ]
+
+    move_start_cell = encoded_action >> MOVE_START_SHIFT & FIELD_MASK
+    if move_start_cell != NO_CELL:
+        moved_code = cells[move_start_cell]
+        key_delta ^= (
+            CELL_KEYS[move_start_cell][moved_code]
+            ^ CELL_KEYS[encoded_action >> MOVE_END_SHIFT & FIELD_MASK][moved_code]
+        )
+
+    return key_delta
@@ -0,0 +1,33 @@
+import random
+from collections.abc import Iterator
+
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.encoded_action import FIELD_MASK
+from aiqualin.classes.game import N_OPEN_TILES, create_full_closed_tiles
+from aiqualin.classes.tile import Tile
+
+
+def random_game(rng: random.Random) -> Iterator[tuple[CompactBoard, list[Tile]]]:
+    """Yield the board and the open tiles before every turn of a random game.
+
+    The closed tiles are shuffled with `rng` and every action is drawn from the
+    actions of the position with `rng`.
+    """
+    closed_tiles = create_full_closed_tiles()
+    rng.shuffle(closed_tiles)
+    open_tiles = [closed_tiles.pop() for _ in range(N_OPEN_TILES)]
+
+    board = CompactBoard.empty_board()
+    while len(open_tiles) > 0:
+        yield board, open_tiles.copy()
+
+        encoded_action = rng.choice(
+            ActionGenerator(board, open_tiles, []).generate_encoded_actions()
+        )
+        board = board.apply_encoded_action(encoded_action)
+        open_tiles = [
+            tile for tile in open_tiles if tile.code != encoded_action & FIELD_MASK
+        ]
+        if len(closed_tiles) > 0:
+            open_tiles.append(closed_tiles.pop())
@@ -0,0 +1,45 @@
+from itertools import chain
+
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.game_scorer import GameScorer
+from aiqualin.classes.tile import Tile
+
+# a position near the end of a game, with three empty cells
+BOARD_STR = """(1,3) (1,2) (5,2) (5,5) (5,3) (5,0)
+(2,0) (2,2) (3,1) EMPTY (1,1) (5,1)
+(0,2) (3,3) (1,5) (2,5) (4,2) (4,4)
+(3,2) (2,3) EMPTY (4,1) (4,3) (5,4)
+(0,1) (0,3) (0,5) (1,0) (4,0) (3,4)
+(0,0) (0,4) (4,5) EMPTY (2,4) (1,4)"""
+
+
+def remaining_tiles(board: CompactBoard) -> list[Tile]:
+    """Return the tiles that are not on the board, sorted by their code."""
+    return sorted(
+        set(create_full_closed_tiles()) - set(chain.from_iterable(board.tiles)),
+        key=lambda tile: tile.code,
+    )
+
+
+def lead(board: CompactBoard, side: type[Animal | Color]) -> int:
+    score = GameScorer(board).score
+    return score if side == Animal else -score
+
+
+def minimax_values(board, open_tiles, side) -> dict:
+    # brute force values of every action when the opponent replies optimally
+    values = {}
+    for action in ActionGenerator(board, open_tiles, []).generate_actions():
+        next_board = board.apply_action(action)
+        next_open_tiles = [tile for tile in open_tiles if tile != action.placement_tile]
+        replies = ActionGenerator(next_board, next_open_tiles, []).generate_actions()
+        values[action] = min(
+            (lead(next_board.apply_action(reply), side) for reply in replies),
+            default=lead(next_board, side),
+        )
+
+    return values
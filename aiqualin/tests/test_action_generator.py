@@ -1,12 +1,19 @@
+import random
 from itertools import chain
 
 from aiqualin.classes.action import Action
-from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.action_generator import (
+    DIRECTIONS,
+    ActionGenerator,
+    reachable_cells_mask,
+)
 from aiqualin.classes.animal import Animal
 from aiqualin.classes.board import Board
 from aiqualin.classes.color import Color
+from aiqualin.classes.encoded_action import EncodedAction
 from aiqualin.classes.game import create_full_closed_tiles
 from aiqualin.classes.tile import Tile
+from aiqualin.tests.random_game import random_game
 
 
 def test_start_moves():
@@ -341,3 +348,43 @@ def test_endgame() -> None:
 
 
 # test_endgame()
+
+
+def test_reachable_cells_mask() -> None:
+    def mask(*positions: tuple[int, int]) -> int:
+        return sum(1 << (row * 6 + col) for row, col in positions)
+
+    # tiles at (2, 2), (2, 4) and (0, 2)
+    occupancy = mask((2, 2), (2, 4), (0, 2))
+    cell = 2 * 6 + 2
+
+    right, left, down, up = (
+        reachable_cells_mask(cell, DIRECTIONS.index(direction), occupancy)
+        for direction in [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    )
+
+    assert right == mask((2, 3))
+    assert left == mask((2, 1), (2, 0))
+    assert down == mask((3, 2), (4, 2), (5, 2))
+    assert up == mask((1, 2))
+
+
+def test_factored_actions_match_generate_actions() -> None:
+    for board, open_tiles in random_game(random.Random(0)):
+        ag = ActionGenerator(board=board, open_tiles=open_tiles, closed_tiles=[])
+        actions = ag.generate_actions()
+
+        moves = ag.generate_moves()
+        assert len(set(moves)) == len(moves) == ag.count_moves()
+
+        factored_actions = [
+            action for move in moves for action in ag.generate_placements(move)
+        ]
+        assert len(factored_actions) == len(actions) == ag.count_actions()
+        assert set(factored_actions) == actions
+
+        streamed_actions = list(ag.iter_actions())
+        assert len(streamed_actions) == len(actions)
+        assert [
+            EncodedAction.from_action(action) for action in streamed_actions
+        ] == ag.generate_encoded_actions()
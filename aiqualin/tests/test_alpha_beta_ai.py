@@ -0,0 +1,48 @@
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.alpha_beta_ai import AlphaBetaAI
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.simple_score_based_ai import SimpleScoreBasedAI
+from aiqualin.tests.search_position import (
+    BOARD_STR,
+    lead,
+    minimax_values,
+    remaining_tiles,
+)
+
+
+def test_depth_two_matches_minimax():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+
+    for side in (Animal, Color):
+        values = minimax_values(board, open_tiles, side)
+
+        player = AlphaBetaAI(side, depth=2, max_branching=None)
+        action = player.next_action(board, open_tiles, [])
+
+        assert values[action] == max(values.values())
+
+
+def test_depth_one_is_greedy():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+
+    for side in (Animal, Color):
+        action = AlphaBetaAI(side, depth=1).next_action(board, open_tiles, [])
+        greedy_action = SimpleScoreBasedAI(side).next_action(board, open_tiles, [])
+
+        assert lead(board.apply_action(action), side) == lead(
+            board.apply_action(greedy_action), side
+        )
+
+
+def test_returns_legal_action_within_time_budget():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+
+    player = AlphaBetaAI(Animal, depth=3, time_budget=0.0)
+    action = player.next_action(board, open_tiles, [])
+
+    assert action in ActionGenerator(board, open_tiles, []).generate_actions()
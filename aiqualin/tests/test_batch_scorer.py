@@ -0,0 +1,86 @@
+import random
+
+import pytest
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.game_scorer import score_cells
+from aiqualin.classes.tile import EMPTY_TILE_CODE
+
+np = pytest.importorskip("numpy")
+
+from aiqualin.classes.batch_scorer import cells_to_array, score_boards  # noqa: E402
+
+
+def test_batch_scores_match_single_scores():
+    rng = random.Random(0)
+    codes = [tile.code for tile in create_full_closed_tiles()]
+
+    boards = [bytes([EMPTY_TILE_CODE] * 36), bytes(sorted(codes))]
+    for _ in range(200):
+        n_tiles = rng.randint(0, 36)
+        cells = rng.sample(codes, n_tiles) + [EMPTY_TILE_CODE] * (36 - n_tiles)
+        rng.shuffle(cells)
+        boards.append(bytes(cells))
+
+    animal_scores, color_scores = score_boards(cells_to_array(boards))
+
+    assert [
+        (int(animal_score), int(color_score))
+        for animal_score, color_score in zip(animal_scores, color_scores)
+    ] == [score_cells(cells) for cells in boards]
+
+
+def test_flat_boards_are_accepted():
+    cells = bytes(sorted(tile.code for tile in create_full_closed_tiles()))
+    flat_boards = np.frombuffer(cells, dtype=np.uint8).reshape(1, 36)
+
+    animal_scores, color_scores = score_boards(flat_boards)
+
+    assert (int(animal_scores[0]), int(color_scores[0])) == score_cells(cells)
+
+
+def test_successor_arrays_match_applied_actions():
+    tiles = create_full_closed_tiles()
+    random.Random(1).shuffle(tiles)
+
+    board = CompactBoard.empty_board()
+    for i in range(12):
+        board = board.apply_encoded_action(
+            random.Random(i).choice(
+                ActionGenerator(board, tiles[i : i + 1], []).generate_encoded_actions()
+            )
+        )
+    action_generator = ActionGenerator(board, tiles[12:18], [])
+
+    n_actions = action_generator.count_actions()
+    successors = np.zeros((n_actions + 5, 36), dtype=np.uint8)
+    encoded_actions = np.zeros(n_actions + 5, dtype=np.int64)
+    successors, encoded_actions = action_generator.generate_successor_arrays(
+        successors, encoded_actions
+    )
+
+    expected_actions = action_generator.generate_encoded_actions()
+    assert encoded_actions.tolist() == expected_actions
+    assert [bytes(row) for row in successors] == [
+        board.apply_encoded_action(encoded_action).cells
+        for encoded_action in expected_actions
+    ]
+
+    animal_scores, _ = score_boards(successors)
+    assert int(animal_scores[-1]) == score_cells(bytes(successors[-1]))[0]
+
+
+def test_successor_arrays_that_are_too_small_are_rejected():
+    tiles = create_full_closed_tiles()
+    action_generator = ActionGenerator(CompactBoard.empty_board(), tiles[:6], [])
+    n_actions = action_generator.count_actions()
+
+    with pytest.raises(ValueError, match="successors"):
+        action_generator.generate_successor_arrays(
+            np.zeros((n_actions - 1, 36), dtype=np.uint8)
+        )
+    with pytest.raises(ValueError, match="encoded_actions"):
+        action_generator.generate_successor_arrays(
+            encoded_actions=np.zeros(n_actions - 1, dtype=np.int64)
+        )
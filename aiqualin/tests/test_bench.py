@@ -0,0 +1,28 @@
+import json
+
+from aiqualin.bench import PHASE_N_TILES, create_corpus, run_benchmarks
+from aiqualin.classes.tile import EMPTY_TILE
+
+
+def test_corpus_is_seeded():
+    corpus = create_corpus(seed=1, n_positions=2)
+
+    assert corpus == create_corpus(seed=1, n_positions=2)
+    for phase, positions in corpus.items():
+        for position in positions:
+            n_tiles = sum(
+                tile != EMPTY_TILE for row in position.board.tiles for tile in row
+            )
+            assert n_tiles == PHASE_N_TILES[phase]
+
+
+def test_results_are_json():
+    results = run_benchmarks(
+        n_positions=1, repeat=1, player_options={"SimpleScoreBasedAI": {}}
+    )
+    results = json.loads(json.dumps(results))
+
+    assert set(results["results"]) == set(PHASE_N_TILES)
+    for timings in results["results"].values():
+        assert "SimpleScoreBasedAI.next_action" in timings
+        assert timings["GameScorer.score"]["n"] == 1
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.board import Board
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.tile import EMPTY_TILE, Tile
+from aiqualin.tests.random_game import random_game
+
+
+def test_empty_board():
+    board = CompactBoard.empty_board()
+
+    assert board.is_empty()
+    assert board.tiles == tuple((EMPTY_TILE,) * 6 for _ in range(6))
+    assert board == CompactBoard.from_board(Board.empty_board())
+
+
+def test_tile_code_round_trip():
+    for tile in [*create_full_closed_tiles(), EMPTY_TILE]:
+        assert Tile.from_code(tile.code) == tile
+
+
+def test_apply_action_matches_board():
+    rng = random.Random(0)
+
+    for compact_board, open_tiles in random_game(rng):
+        board = compact_board.to_board()
+        assert compact_board.cells == board.cells
+
+        actions = ActionGenerator(board, open_tiles, []).generate_actions()
+        action = rng.choice(sorted(actions, key=str))
+
+        next_compact_board = compact_board.apply_action(action)
+        next_board = board.apply_action(action)
+
+        assert next_compact_board.cells == next_board.cells
+        assert next_compact_board.to_board() == next_board
+        assert not next_compact_board.is_empty()
+
+
+def test_apply_action_does_not_modify_board():
+    board = CompactBoard.empty_board()
+    tile = Tile(animal=Animal.CRAB, color=Color.RED)
+
+    new_board = board.apply_action(Action(-1, -1, -1, -1, 2, 3, tile))
+
+    assert board.is_empty()
+    assert new_board.tiles[2][3] == tile
+
+
+def test_place_on_non_empty_tile():
+    tile = Tile(animal=Animal.CRAB, color=Color.RED)
+    board = CompactBoard.empty_board().apply_action(Action(-1, -1, -1, -1, 0, 0, tile))
+
+    with pytest.raises(AssertionError):
+        board.apply_action(
+            Action(-1, -1, -1, -1, 0, 0, Tile(animal=Animal.FISH, color=Color.RED))
+        )
+
+    with pytest.raises(ValueError):
+        board.apply_action(Action(0, 0, -1, -1, 1, 1, tile))
+
+
+def test_from_pretty_string():
+    board_str = """(1,3) (1,2) (5,2) (5,5) (5,3) (5,0)
+(2,0) (2,2) (3,1) (3,0) (1,1) (5,1)
+(0,2) (3,3) (1,5) (2,5) (4,2) (4,4)
+(3,2) (2,3) (3,5) (4,1) (4,3) (5,4)
+(0,1) (0,3) (0,5) (1,0) (4,0) (3,4)
+(0,0) (0,4) (4,5) EMPTY (2,4) (1,4)"""
+
+    board = CompactBoard.from_pretty_string(board_str)
+
+    assert board == CompactBoard.from_board(Board.from_pretty_string(board_str))
+    assert board.tiles[5][3] == EMPTY_TILE
+    assert board.tiles[0][0] == Tile(animal=Animal.FISH, color=Color.PURPLE)
@@ -0,0 +1,60 @@
+import random
+
+from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.encoded_action import NO_CELL, EncodedAction
+from aiqualin.classes.game_scorer import GameScorer
+from aiqualin.classes.tile import Tile
+from aiqualin.tests.random_game import random_game
+
+
+def test_string_round_trip():
+    action = Action.from_string("1 2 1 5 3 4 2 3")
+    encoded_action = EncodedAction.from_action(action)
+
+    assert encoded_action.to_action() == action
+    assert encoded_action.to_string() == "1 2 1 5 3 4 2 3"
+    assert EncodedAction.from_string("12153423") == encoded_action
+    assert encoded_action.move_start_cell == 1 * 6 + 2
+    assert encoded_action.move_end_cell == 1 * 6 + 5
+    assert encoded_action.placement_cell == 3 * 6 + 4
+    assert encoded_action.tile_code == Tile(Animal.JELLYFISH, Color.PURPLE).code
+
+
+def test_start_action_round_trip():
+    encoded_action = EncodedAction.from_string("3 4 2 3")
+
+    assert not encoded_action.has_movement()
+    assert encoded_action.move_start_cell == encoded_action.move_end_cell == NO_CELL
+    assert encoded_action.to_action() == Action(
+        -1, -1, -1, -1, 3, 4, Tile(Animal.JELLYFISH, Color.PURPLE)
+    )
+    assert encoded_action.to_string() == "3 4 2 3"
+
+
+def test_encoded_actions_match_actions():
+    rng = random.Random(2)
+
+    for board, open_tiles in random_game(rng):
+        ag = ActionGenerator(board=board, open_tiles=open_tiles, closed_tiles=[])
+        actions = ag.generate_actions()
+        encoded_actions = ag.generate_encoded_actions()
+
+        assert len(set(encoded_actions)) == len(encoded_actions)
+        assert {
+            EncodedAction(encoded_action).to_action()
+            for encoded_action in encoded_actions
+        } == actions
+
+        gs = GameScorer(board=board)
+        for encoded_action in rng.sample(
+            encoded_actions, min(len(encoded_actions), 20)
+        ):
+            action = EncodedAction(encoded_action).to_action()
+
+            assert board.apply_encoded_action(encoded_action) == board.apply_action(
+                action
+            )
+            assert gs.encoded_delta(encoded_action) == gs.delta(action)
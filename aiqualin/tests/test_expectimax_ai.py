@@ -0,0 +1,61 @@
+import random
+
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.expectimax_ai import ExpectimaxAI
+from aiqualin.tests.search_position import BOARD_STR, lead, remaining_tiles
+
+
+def expectimax_values(board, open_tiles, closed_tiles, side) -> dict:
+    # brute force values of every action when every closed tile is drawn with
+    # the same probability and the opponent replies optimally
+    values = {}
+    for action in ActionGenerator(board, open_tiles, []).generate_actions():
+        next_board = board.apply_action(action)
+        remaining_tiles = [tile for tile in open_tiles if tile != action.placement_tile]
+
+        draw_values = []
+        for draw in closed_tiles:
+            replies = ActionGenerator(
+                next_board, remaining_tiles + [draw], []
+            ).generate_actions()
+            draw_values.append(
+                min(lead(next_board.apply_action(reply), side) for reply in replies)
+            )
+
+        values[action] = sum(draw_values) / len(draw_values)
+
+    return values
+
+
+def test_depth_two_matches_expectimax():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    tiles = remaining_tiles(board)
+    open_tiles, closed_tiles = tiles[:1], tiles[1:]
+
+    for side in (Animal, Color):
+        values = expectimax_values(board, open_tiles, closed_tiles, side)
+
+        player = ExpectimaxAI(side, depth=2, max_branching=None, n_samples=2)
+        action = player.next_action(board, open_tiles, closed_tiles)
+
+        assert values[action] == max(values.values())
+        # positions are memoised per turn, no transposition table is created
+        assert "transposition_table" not in vars(player)
+
+
+def test_sampled_draws_are_reproducible():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    tiles = remaining_tiles(board)
+    open_tiles, closed_tiles = tiles[:1], tiles[1:]
+
+    actions = {
+        ExpectimaxAI(Animal, n_samples=1, rng=random.Random(0)).next_action(
+            board, open_tiles, closed_tiles
+        )
+        for _ in range(3)
+    }
+
+    assert len(actions) == 1
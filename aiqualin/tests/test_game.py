@@ -0,0 +1,36 @@
+import random
+
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.game import Game, spawn_rng
+from aiqualin.classes.mcts_ai import MCTSAI
+
+
+def play_seeded_game(seed: int) -> Game:
+    game = Game(
+        players=(MCTSAI(Color, n_iterations=5), MCTSAI(Animal, n_iterations=5)),
+        verbose=False,
+        rng=random.Random(seed),
+    )
+    game.play()
+
+    return game
+
+
+def test_same_seed_gives_same_game():
+    assert play_seeded_game(1).board == play_seeded_game(1).board
+    assert play_seeded_game(1).board != play_seeded_game(2).board
+
+
+def test_spawned_streams_are_independent_and_reproducible():
+    def first_draw(name: str) -> float:
+        return spawn_rng(random.Random(0), name).random()
+
+    assert first_draw("player_0") == first_draw("player_0")
+    assert first_draw("player_0") != first_draw("player_1")
+
+
+def test_headless_game_prints_nothing(capsys):
+    Game(verbose=False, rng=random.Random(0)).play()
+
+    assert capsys.readouterr().out == ""
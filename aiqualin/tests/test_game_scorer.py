@@ -1,9 +1,16 @@
+import random
+
+import pytest
 from aiqualin.classes.action import Action
+from aiqualin.classes.action_generator import ActionGenerator
 from aiqualin.classes.animal import Animal
 from aiqualin.classes.board import Board
 from aiqualin.classes.color import Color
-from aiqualin.classes.game_scorer import GameScorer
-from aiqualin.classes.tile import Tile
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.game_scorer import LENGTH_TO_SCORE_MAP, GameScorer, score_cells
+from aiqualin.classes.tile import EMPTY_TILE, Tile
+from aiqualin.tests.random_game import random_game
 
 
 def test_empty_board():
@@ -347,3 +354,53 @@ def test_board_from_manual() -> None:
 
 
 # test_board_from_manual()
+
+
+def test_native_scorer_matches_graph_scorer() -> None:
+    pytest.importorskip("networkx")
+
+    rng = random.Random(0)
+    all_tiles = [*create_full_closed_tiles()] + [EMPTY_TILE] * 36
+
+    for _ in range(200):
+        tiles = rng.sample(all_tiles, 36)
+        board = Board(tiles=[tiles[row * 6 : (row + 1) * 6] for row in range(6)])
+
+        gs = GameScorer(board=board)
+
+        assert gs.score_properties() == (
+            gs.graph_score_for_property(Animal),
+            gs.graph_score_for_property(Color),
+        )
+        assert GameScorer(CompactBoard.from_board(board)).score == gs.score
+
+
+def test_delta_matches_full_scoring() -> None:
+    rng = random.Random(1)
+
+    for board, open_tiles in random_game(rng):
+        actions = sorted(
+            ActionGenerator(board, open_tiles, []).generate_actions(), key=str
+        )
+        gs = GameScorer(board=board)
+        animal_score, color_score = gs.score_properties()
+
+        for action in rng.sample(actions, min(len(actions), 50)):
+            next_animal_score, next_color_score = GameScorer(
+                board.apply_action(action)
+            ).score_properties()
+
+            assert gs.delta(action) == (
+                next_animal_score - animal_score,
+                next_color_score - color_score,
+            )
+
+
+def test_components_larger_than_six_are_scored() -> None:
+    # a board can not hold more than 6 tiles of an animal in a real game, but
+    # the scorer handles components of any size
+    code = Tile(animal=Animal.from_index(0), color=Color.from_index(0)).code
+    cells = bytes([code] * 36)
+
+    assert score_cells(cells) == (LENGTH_TO_SCORE_MAP[36], LENGTH_TO_SCORE_MAP[36])
+    assert LENGTH_TO_SCORE_MAP[36] == 630
@@ -0,0 +1,34 @@
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.iterative_deepening_ai import IterativeDeepeningAI
+from aiqualin.tests.search_position import BOARD_STR, minimax_values, remaining_tiles
+
+
+def test_completed_depth_two_matches_minimax():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+
+    for side in (Animal, Color):
+        values = minimax_values(board, open_tiles, side)
+
+        player = IterativeDeepeningAI(
+            side, time_budget=60.0, max_depth=2, max_branching=None
+        )
+        action = player.next_action(board, open_tiles, [])
+
+        assert player.depth_reached == 2
+        assert player.n_nodes_searched > 0
+        assert values[action] == max(values.values())
+
+
+def test_returns_depth_one_action_when_out_of_time():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+
+    player = IterativeDeepeningAI(Animal, time_budget=0.0)
+    action = player.next_action(board, open_tiles, [])
+
+    assert player.depth_reached == 1
+    assert action in ActionGenerator(board, open_tiles, []).generate_actions()
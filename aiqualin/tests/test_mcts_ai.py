@@ -0,0 +1,67 @@
+import random
+
+from aiqualin.classes.action_generator import (
+    ActionGenerator,
+    cells_occupancy,
+    iter_encoded_actions,
+    occupancy_after_action,
+    sample_encoded_action,
+)
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard, make_encoded_action
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.mcts_ai import MCTSAI
+from aiqualin.tests.search_position import BOARD_STR, minimax_values, remaining_tiles
+
+
+def test_sampled_actions_are_legal():
+    rng = random.Random(0)
+    tiles = create_full_closed_tiles()
+    rng.shuffle(tiles)
+
+    cells = bytearray(CompactBoard.empty_board().cells)
+    occupancy = cells_occupancy(cells)
+    for tile in tiles:
+        tile_codes = [tile.code]
+        legal_actions = set(iter_encoded_actions(cells, tile_codes))
+
+        for _ in range(20):
+            assert sample_encoded_action(occupancy, tile_codes, rng) in legal_actions
+
+        encoded_action = sample_encoded_action(occupancy, tile_codes, rng)
+        make_encoded_action(cells, encoded_action)
+        occupancy = occupancy_after_action(occupancy, encoded_action)
+
+        assert occupancy == cells_occupancy(cells)
+
+
+def test_opening_action_is_legal():
+    tiles = create_full_closed_tiles()
+    random.Random(1).shuffle(tiles)
+    board = CompactBoard.empty_board()
+
+    player = MCTSAI(Animal, n_iterations=200, rng=random.Random(2))
+    action = player.next_action(board, tiles[:6], tiles[6:])
+
+    assert action in ActionGenerator(board, tiles[:6], tiles[6:]).generate_actions()
+    assert player.n_playouts == 200
+
+
+def test_endgame_finds_winning_action():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+    # fill one of the three empty cells, so that the game ends after two plies
+    # and the minimax values are the final leads
+    board = board.apply_encoded_action(
+        min(ActionGenerator(board, open_tiles[:1], []).generate_encoded_actions())
+    )
+    open_tiles = open_tiles[1:]
+
+    for side in (Animal, Color):
+        values = minimax_values(board, open_tiles, side)
+
+        player = MCTSAI(side, n_iterations=2000, rng=random.Random(3))
+        action = player.next_action(board, open_tiles, [])
+
+        assert (values[action] > 0) == (max(values.values()) > 0)
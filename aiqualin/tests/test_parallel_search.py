@@ -0,0 +1,57 @@
+import random
+
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.parallel_search import ParallelAlphaBetaAI, ParallelMCTSAI
+from aiqualin.tests.search_position import BOARD_STR, minimax_values, remaining_tiles
+
+
+def test_parallel_alpha_beta_matches_minimax():
+    board = CompactBoard.from_pretty_string(BOARD_STR)
+    open_tiles = remaining_tiles(board)
+
+    for side in (Animal, Color):
+        values = minimax_values(board, open_tiles, side)
+
+        player = ParallelAlphaBetaAI(side, n_workers=2, depth=2, max_branching=None)
+        try:
+            action = player.next_action(board, open_tiles, [])
+        finally:
+            player.close()
+
+        assert values[action] == max(values.values())
+
+
+def test_parallel_mcts_merges_workers():
+    tiles = create_full_closed_tiles()
+    random.Random(1).shuffle(tiles)
+    board = CompactBoard.empty_board()
+
+    player = ParallelMCTSAI(Animal, n_workers=2, n_iterations=100, rng=random.Random(2))
+    try:
+        action = player.next_action(board, tiles[:6], tiles[6:])
+    finally:
+        player.close()
+
+    assert action in ActionGenerator(board, tiles[:6], tiles[6:]).generate_actions()
+    assert player.n_playouts == 100
+
+
+def test_parallel_mcts_without_iterations_returns_legal_action():
+    tiles = create_full_closed_tiles()
+    random.Random(1).shuffle(tiles)
+    board = CompactBoard.empty_board()
+
+    player = ParallelMCTSAI(
+        Animal, n_workers=2, n_iterations=None, time_budget=0.0, rng=random.Random(2)
+    )
+    try:
+        action = player.next_action(board, tiles[:6], tiles[6:])
+    finally:
+        player.close()
+
+    assert action in ActionGenerator(board, tiles[:6], tiles[6:]).generate_actions()
+    assert player.n_playouts == 0
@@ -0,0 +1,81 @@
+import os
+import pstats
+
+import pytest
+from aiqualin.classes.game import Game
+from aiqualin.classes.profiling import PROFILING, configure_profiling, profiled
+
+
+@pytest.fixture
+def restore_profiling():
+    previous = (PROFILING.directory, PROFILING.scope, PROFILING.output_format)
+    previous_environment = {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith("AIQUALIN_PROFILE")
+    }
+    yield
+    configure_profiling(*previous)
+    for key in (
+        "AIQUALIN_PROFILE",
+        "AIQUALIN_PROFILE_SCOPE",
+        "AIQUALIN_PROFILE_FORMAT",
+    ):
+        os.environ.pop(key, None)
+    os.environ.update(previous_environment)
+
+
+def busy() -> int:
+    return sum(i * i for i in range(200_000))
+
+
+def test_profiling_is_off_by_default(tmp_path, restore_profiling):
+    configure_profiling(None)
+
+    with profiled("label", scope="turn"):
+        busy()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pstats_files_are_written_for_the_scope(tmp_path, restore_profiling):
+    configure_profiling(str(tmp_path), scope="turn")
+
+    with profiled("game", scope="game"):
+        with profiled("game_turn_01_player", scope="turn"):
+            busy()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["game_turn_01_player.pstats"]
+    stats = pstats.Stats(str(tmp_path / "game_turn_01_player.pstats"))
+    assert any(function[2] == "busy" for function in stats.stats)
+
+
+def test_collapsed_stacks_are_written(tmp_path, restore_profiling):
+    configure_profiling(str(tmp_path), scope="game", output_format="collapsed")
+
+    with profiled("game", scope="game"):
+        busy()
+
+    lines = (tmp_path / "game.collapsed").read_text().splitlines()
+    assert len(lines) > 0
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+    assert any("busy" in line for line in lines)
+
+
+def test_missing_directory_from_the_environment_is_created(tmp_path, restore_profiling):
+    # as if only AIQUALIN_PROFILE was set, without `configure_profiling`
+    directory = tmp_path / "profiles"
+    PROFILING.directory = str(directory)
+    PROFILING.scope = "turn"
+    PROFILING.output_format = "pstats"
+
+    with profiled("game_turn_01_player", scope="turn"):
+        busy()
+
+    assert (directory / "game_turn_01_player.pstats").exists()
+
+
+def test_games_get_distinct_ids():
+    assert Game(verbose=False).game_id != Game(verbose=False).game_id
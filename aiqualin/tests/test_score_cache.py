@@ -0,0 +1,62 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.game_scorer import score_cells
+from aiqualin.classes.score_cache import ScoreCache
+from aiqualin.classes.simple_score_based_ai import SimpleScoreBasedAI
+from aiqualin.classes.tile import EMPTY_TILE_CODE
+
+
+def random_cells(rng: random.Random) -> bytes:
+    codes = [tile.code for tile in create_full_closed_tiles()]
+    n_tiles = rng.randint(0, 36)
+    cells = rng.sample(codes, n_tiles) + [EMPTY_TILE_CODE] * (36 - n_tiles)
+    rng.shuffle(cells)
+
+    return bytes(cells)
+
+
+def test_hits_misses_and_eviction():
+    cache = ScoreCache(max_size=2)
+    rng = random.Random(0)
+    first, second, third = (random_cells(rng) for _ in range(3))
+
+    assert cache.scores(first) == score_cells(first)
+    assert cache.scores(bytearray(first)) == score_cells(first)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.scores(second)
+    cache.scores(third)
+    assert len(cache) == 2
+
+    # the first board was the least recently used one
+    cache.scores(first)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_cache_is_thread_safe():
+    cache = ScoreCache(max_size=50)
+    rng = random.Random(1)
+    boards = [random_cells(rng) for _ in range(100)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(cache.scores, boards * 10))
+
+    assert results == [score_cells(cells) for cells in boards] * 10
+    assert cache.hits + cache.misses == 1000
+    assert len(cache) <= 50
+
+
+def test_players_share_the_cache():
+    board = CompactBoard(cells=random_cells(random.Random(2)))
+    animal_player = SimpleScoreBasedAI(Animal)
+    color_player = SimpleScoreBasedAI(Color)
+    animal_player.score_cache = color_player.score_cache = ScoreCache()
+
+    assert animal_player.our_score(board) == color_player.their_score(board)
+    assert animal_player.their_score(board) == color_player.our_score(board)
+    assert animal_player.score_cache.misses == 1
@@ -0,0 +1,94 @@
+import random
+
+from aiqualin.classes.action_generator import ActionGenerator
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.game_scorer import score_cells
+from aiqualin.classes.symmetry import TRANSFORMS, canonical_board, canonical_key
+from aiqualin.classes.tile import EMPTY_TILE_CODE
+
+
+def random_cells(rng: random.Random, n_tiles: int) -> bytes:
+    codes = [tile.code for tile in create_full_closed_tiles()]
+    cells = rng.sample(codes, n_tiles) + [EMPTY_TILE_CODE] * (36 - n_tiles)
+    rng.shuffle(cells)
+
+    return bytes(cells)
+
+
+def has_every_animal_and_color(cells: bytes) -> bool:
+    codes = [code for code in cells if code != EMPTY_TILE_CODE]
+    return len({code // 7 for code in codes}) == len({code % 7 for code in codes}) == 6
+
+
+def random_permutation(rng: random.Random):
+    animal_permutation = rng.sample(range(6), 6) + [6]
+    color_permutation = rng.sample(range(6), 6) + [6]
+
+    def permute(code: int) -> int:
+        animal_index, color_index = divmod(code, 7)
+        return animal_permutation[animal_index] * 7 + color_permutation[color_index]
+
+    return permute
+
+
+def test_canonical_key_is_invariant_under_symmetries():
+    rng = random.Random(5)
+
+    for _ in range(50):
+        cells = random_cells(rng, rng.randint(1, 30))
+        open_codes = [
+            code
+            for code in (tile.code for tile in create_full_closed_tiles())
+            if code not in cells
+        ][:6]
+        key = canonical_key(cells, open_codes)
+
+        for transform in TRANSFORMS:
+            symmetric_cells = bytes(cells[cell] for cell in transform)
+
+            assert canonical_key(symmetric_cells, open_codes) == key
+
+
+def test_canonical_key_is_invariant_under_renaming():
+    rng = random.Random(7)
+
+    for _ in range(50):
+        # every animal and every color is on the board
+        cells = random_cells(rng, rng.randint(12, 30))
+        while not has_every_animal_and_color(cells):
+            cells = random_cells(rng, rng.randint(12, 30))
+        open_codes = [
+            code
+            for code in (tile.code for tile in create_full_closed_tiles())
+            if code not in cells
+        ][:6]
+        key = canonical_key(cells, open_codes)
+
+        permute = random_permutation(rng)
+        for transform in TRANSFORMS:
+            symmetric_cells = bytes(permute(cells[cell]) for cell in transform)
+            symmetric_open_codes = [permute(code) for code in open_codes]
+
+            assert score_cells(symmetric_cells) == score_cells(cells)
+            assert canonical_key(symmetric_cells, symmetric_open_codes) == key
+
+
+def test_canonical_board_keeps_scores():
+    rng = random.Random(6)
+
+    for _ in range(50):
+        board = CompactBoard(cells=random_cells(rng, rng.randint(1, 36)))
+
+        assert score_cells(canonical_board(board).cells) == score_cells(board.cells)
+
+
+def test_opening_actions_are_reduced():
+    tiles = create_full_closed_tiles()
+    ag = ActionGenerator(CompactBoard.empty_board(), tiles[:6], tiles[6:])
+
+    canonical_actions = ag.generate_canonical_encoded_actions()
+
+    assert set(canonical_actions) <= set(ag.generate_encoded_actions())
+    # a single tile can only be placed on 6 cells that are not symmetric
+    assert len(canonical_actions) <= 6 * 6
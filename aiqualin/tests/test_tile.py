@@ -0,0 +1,33 @@
+import copy
+import pickle
+
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.game import create_full_closed_tiles
+from aiqualin.classes.tile import EMPTY_TILE, Tile
+
+
+def test_tiles_are_interned():
+    tile = Tile(animal=Animal.CRAB, color=Color.RED)
+
+    assert Tile(Animal.CRAB, Color.RED) is tile
+    # plain values are turned into the enums and do not change the shared tile
+    assert Tile("crab", "red") is tile
+    assert tile.animal is Animal.CRAB and tile.color is Color.RED
+    assert Tile.from_code(tile.code) is tile
+    assert Tile.from_short_string(tile.short_string()) is tile
+    assert Tile(animal=Animal.EMPTY, color=Color.EMPTY) is EMPTY_TILE
+
+    assert pickle.loads(pickle.dumps(tile)) is tile
+    assert copy.copy(tile) is tile
+    assert copy.deepcopy([tile])[0] is tile
+
+
+def test_index_tables_round_trip():
+    for enum_class in (Animal, Color):
+        for index, member in enumerate(enum_class):
+            assert enum_class.to_index(member) == index
+            assert enum_class.from_index(index) is member
+
+    codes = [tile.code for tile in create_full_closed_tiles()]
+    assert len(set(codes)) == 36
@@ -0,0 +1,48 @@
+import json
+
+from aiqualin.classes.timer import TIMERS, Timer, TimerRegistry, percentile
+
+
+def test_percentiles():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([3.0], 0.99) == 3.0
+
+
+def test_spans_are_only_recorded_when_enabled():
+    registry = TimerRegistry()
+
+    with registry.span("disabled"):
+        pass
+    assert registry.intervals == {}
+
+    registry.enable()
+    for _ in range(3):
+        with registry.span("enabled"):
+            pass
+
+    summary = registry.summary()
+    assert list(summary) == ["enabled"]
+    assert summary["enabled"]["count"] == 3
+    assert json.loads(registry.to_json())["enabled"]["count"] == 3
+    assert registry.format_table().splitlines()[1].startswith("enabled")
+
+
+def test_named_timers_report_to_the_registry():
+    previous_intervals, previous_enabled = TIMERS.intervals, TIMERS.enabled
+    TIMERS.intervals = {}
+    TIMERS.enable()
+    try:
+        for _ in range(2):
+            with Timer("test_span", no_print=True):
+                pass
+        with Timer(no_print=True):
+            pass
+
+        assert list(TIMERS.intervals) == ["test_span"]
+        assert len(TIMERS.intervals["test_span"]) == 2
+    finally:
+        TIMERS.intervals, TIMERS.enabled = previous_intervals, previous_enabled
@@ -0,0 +1,26 @@
+from aiqualin.tournament import GameSpec, play_game, run_tournament
+
+
+def test_games_are_reproducible():
+    spec = GameSpec(
+        player_a="SimpleScoreBasedAI",
+        player_b="AlphaBetaAI",
+        options_b={"depth": 1},
+        seed=3,
+    )
+
+    assert play_game(spec) == play_game(spec)
+
+
+def test_tournament_counts_every_game():
+    result = run_tournament(
+        "SimpleScoreBasedAI",
+        "AlphaBetaAI",
+        n_games=2,
+        options_b={"depth": 1},
+        n_workers=2,
+    )
+
+    assert len(result.results) == 2
+    assert result.n_wins + result.n_draws + result.n_losses == 2
+    assert result.games_per_second > 0
@@ -0,0 +1,47 @@
+import random
+
+from aiqualin.classes.compact_board import CompactBoard
+from aiqualin.classes.transposition_table import Bound, TranspositionTable
+from aiqualin.classes.zobrist import zobrist_key
+from aiqualin.tests.random_game import random_game
+
+
+def test_zobrist_key_is_updated_incrementally():
+    # the boards of the random game are created with apply_encoded_action,
+    # which updates the key incrementally
+    keys = set()
+    for board, _ in random_game(random.Random(4)):
+        assert board.zobrist_key == zobrist_key(board.cells)
+        assert board == CompactBoard(cells=board.cells)
+
+        keys.add(board.zobrist_key)
+
+    assert len(keys) == 36
+
+
+def test_depth_preferred_replacement():
+    table = TranspositionTable()
+
+    table.store(1, depth=3, value=5, bound=Bound.EXACT, best_action=10)
+    table.store(1, depth=2, value=7, bound=Bound.EXACT, best_action=11)
+    assert table.get(1).value == 5
+
+    table.store(1, depth=3, value=6, bound=Bound.LOWER, best_action=12)
+    entry = table.get(1)
+    assert (entry.value, entry.bound, entry.best_action) == (6, Bound.LOWER, 12)
+
+
+def test_least_recently_used_entry_is_evicted():
+    table = TranspositionTable(max_size=2)
+
+    table.store(1, depth=1, value=1, bound=Bound.EXACT)
+    table.store(2, depth=1, value=2, bound=Bound.EXACT)
+    assert table.get(1) is not None
+
+    table.store(3, depth=1, value=3, bound=Bound.EXACT)
+
+    assert len(table) == 2
+    assert table.get(2) is None
+    assert table.get(1).value == 1
+    assert table.get(3).value == 3
+    assert (table.hits, table.misses) == (3, 1)
@@ -0,0 +1,241 @@
+"""
+Play many headless games between two players and report how they did.
+
+Example:
+    python -m aiqualin.tournament SimpleScoreBasedAI AlphaBetaAI \
+        --n-games 100 --b-options '{"depth": 1}'
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import fmean
+from time import perf_counter
+
+from aiqualin.classes.animal import Animal
+from aiqualin.classes.color import Color
+from aiqualin.classes.game import Game
+from aiqualin.classes.player import AbstractPlayer
+from aiqualin.classes.profiling import (
+    add_profiling_arguments,
+    configure_profiling_from_arguments,
+)
+from aiqualin.classes.timer import TIMERS
+
+# the players that can be referred to by their class name alone
+PLAYER_MODULES = {
+    "SimpleScoreBasedAI": "aiqualin.classes.simple_score_based_ai",
+    "AlphaBetaAI": "aiqualin.classes.alpha_beta_ai",
+    "ExpectimaxAI": "aiqualin.classes.expectimax_ai",
+    "MCTSAI": "aiqualin.classes.mcts_ai",
+    "IterativeDeepeningAI": "aiqualin.classes.iterative_deepening_ai",
+}
+
+
+def load_player_class(name: str) -> type[AbstractPlayer]:
+    """Return a player class from its name or from ``"module.path:ClassName"``."""
+    if ":" in name:
+        module_name, class_name = name.split(":")
+    else:
+        module_name, class_name = PLAYER_MODULES[name], name
+
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@dataclass(frozen=True)
+class GameSpec:
+    player_a: str
+    player_b: str
+    options_a: dict = field(default_factory=dict)
+    options_b: dict = field(default_factory=dict)
+    seed: int = 0
+    # player a plays for colors and moves first if True
+    a_plays_colors: bool = True
+    # whether the intervals of the timed spans of the game are returned
+    collect_timings: bool = False
+
+
+@dataclass(frozen=True)
+class GameResult:
+    # the final score of the side of player a minus the one of player b
+    score_difference: int
+    # the intervals of every timed span, see `TimerRegistry`
+    timings: dict[str, list[float]] = field(default_factory=dict)
+
+
+def play_game(spec: GameSpec) -> GameResult:
+    """Play one headless game, the same spec always gives the same game."""
+    side_a, side_b = (Color, Animal) if spec.a_plays_colors else (Animal, Color)
+    player_a = load_player_class(spec.player_a)(side_a, **spec.options_a)
+    player_b = load_player_class(spec.player_b)(side_b, **spec.options_b)
+
+    # the player that plays for colors moves first
+    players = (player_a, player_b) if spec.a_plays_colors else (player_b, player_a)
+    game = Game(
+        players=players,
+        verbose=False,
+        rng=random.Random(spec.seed),
+        game_id=f"game_{spec.seed:04d}",
+    )
+
+    if not spec.collect_timings:
+        score_animals, score_colors = game.play()
+        timings = {}
+    else:
+        # record the spans of this game only, in case other games are played in
+        # this process as well
+        previous_intervals, previous_enabled = TIMERS.intervals, TIMERS.enabled
+        TIMERS.intervals = {}
+        TIMERS.enable()
+        try:
+            score_animals, score_colors = game.play()
+        finally:
+            timings = TIMERS.intervals
+            TIMERS.intervals, TIMERS.enabled = previous_intervals, previous_enabled
+
+    score_difference = score_animals - score_colors
+    return GameResult(
+        score_difference=-score_difference if spec.a_plays_colors else score_difference,
+        timings=timings,
+    )
+
+
+@dataclass
+class TournamentResult:
+    results: list[GameResult]
+    seconds: float
+
+    @property
+    def n_wins(self) -> int:
+        return sum(result.score_difference > 0 for result in self.results)
+
+    @property
+    def n_draws(self) -> int:
+        return sum(result.score_difference == 0 for result in self.results)
+
+    @property
+    def n_losses(self) -> int:
+        return sum(result.score_difference < 0 for result in self.results)
+
+    @property
+    def mean_score_difference(self) -> float:
+        return fmean(result.score_difference for result in self.results)
+
+    @property
+    def games_per_second(self) -> float:
+        return len(self.results) / self.seconds
+
+
+def run_tournament(
+    player_a: str,
+    player_b: str,
+    n_games: int,
+    options_a: dict | None = None,
+    options_b: dict | None = None,
+    seed: int = 0,
+    n_workers: int | None = None,
+    collect_timings: bool = False,
+) -> TournamentResult:
+    """Play `n_games` games between two players, in worker processes.
+
+    The players switch sides after every game, so that both of them move first
+    equally often. Game ``i`` is seeded with ``seed + i``.
+
+    Args:
+        player_a: The name of the first player, see `load_player_class`.
+        player_b: The name of the second player.
+        n_games: The number of games to play.
+        options_a: The keyword arguments the first player is created with.
+        options_b: The keyword arguments the second player is created with.
+        seed: The seed of the first game.
+        n_workers: The number of worker processes, the number of CPUs if None.
+            The games are played in this process if it is 1.
+        collect_timings: Whether the timed spans of all games are merged into
+            `TIMERS`.
+
+    Returns:
+        The results from the point of view of the first player.
+    """
+    specs = [
+        GameSpec(
+            player_a=player_a,
+            player_b=player_b,
+            options_a=options_a or {},
+            options_b=options_b or {},
+            seed=seed + i,
+            a_plays_colors=i % 2 == 0,
+            collect_timings=collect_timings,
+        )
+        for i in range(n_games)
+    ]
+
+    n_workers = n_workers if n_workers is not None else os.cpu_count() or 1
+
+    start_time = perf_counter()
+    if n_workers == 1:
+        results = [play_game(spec) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(play_game, specs))
+
+    seconds = perf_counter() - start_time
+
+    for result in results:
+        TIMERS.merge(result.timings)
+
+    return TournamentResult(results=results, seconds=seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("player_a", help="class name or module.path:ClassName")
+    parser.add_argument("player_b", help="class name or module.path:ClassName")
+    parser.add_argument("--n-games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--n-workers", type=int, default=None)
+    parser.add_argument(
+        "--a-options", type=json.loads, default={}, help="JSON keyword arguments"
+    )
+    parser.add_argument(
+        "--b-options", type=json.loads, default={}, help="JSON keyword arguments"
+    )
+    parser.add_argument(
+        "--timings",
+        choices=("table", "json"),
+        default=None,
+        help="print where the turns spent their time",
+    )
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
+    configure_profiling_from_arguments(args)
+
+    result = run_tournament(
+        args.player_a,
+        args.player_b,
+        args.n_games,
+        options_a=args.a_options,
+        options_b=args.b_options,
+        seed=args.seed,
+        n_workers=args.n_workers,
+        collect_timings=args.timings is not None,
+    )
+
+    print(f"{args.player_a} vs {args.player_b}, {len(result.results)} games")
+    print(f"  W/D/L: {result.n_wins}/{result.n_draws}/{result.n_losses}")
+    print(f"  Mean score difference: {result.mean_score_difference:+.2f}")
+    print(f"  Games per second: {result.games_per_second:.2f}")
+
+    if args.timings == "table":
+        print()
+        print(TIMERS.format_table())
+    elif args.timings == "json":
+        print(TIMERS.to_json())
+
+
+if __name__ == "__main__":
+    main()